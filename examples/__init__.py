@@ -0,0 +1,4 @@
+"""Example scripts for the MyoLink library.
+
+Run from the project root as modules, e.g. `python -m examples.control_hand`.
+"""
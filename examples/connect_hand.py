@@ -2,15 +2,10 @@
 
 import asyncio
 import logging
-import sys
-import os
-
-# Add project root to path if running script directly
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from bleak import BleakClient
 
-from myolink import discover_devices, DeviceType, Hand # type: ignore
+from myolink import discover_devices_iter, DeviceType, Hand # type: ignore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
@@ -22,19 +17,19 @@ async def main():
 	hand_ad_data = None
 	logger.info("Scanning for Open Bionics Hands (OB2 Hand)...")
 
-	# Use the core discover_devices, filtering for OB2_HAND
-	# Returns Dict[str, Tuple[BLEDevice, ParsedAdvertisingData, int]]
-	discovered_hands = await discover_devices(timeout=5.0, device_type=DeviceType.OB2_HAND)
+	# Stream discovered devices, filtering for OB2_HAND, and stop at the first hand found
+	hand_scan = discover_devices_iter(timeout=5.0, device_type=DeviceType.OB2_HAND)
+	try:
+		async for hand_device, hand_ad_data, rssi in hand_scan:
+			break
+	finally:
+		# Breaking out does not end the scan, close the generator so it stops before connecting
+		await hand_scan.aclose()
 
-	if not discovered_hands:
+	if hand_device is None:
 		logger.error("No OB2 Hand devices found.")
 		return
 
-	# Select the first discovered hand
-	# Extract the tuple (device, parsed_ad, rssi) from the dict values
-	first_hand_info = list(discovered_hands.values())[0]
-	hand_device, hand_ad_data, rssi = first_hand_info # Unpack the tuple
-
 	logger.info(f"Found Hand: {hand_device.address} ({hand_device.name}), RSSI: {rssi}")
 	if hand_ad_data:
 		 logger.info(f"  Details: Schema={hand_ad_data.schema_version}, "
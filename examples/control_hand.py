@@ -1,16 +1,11 @@
 import asyncio
 import logging
 import time
-import sys # Added for sys.path modification
-import os # Added for sys.path modification
-
-# Add project root to path if running script directly
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from bleak import BleakScanner, BleakClient
 
 # Import discovery elements
-from myolink.discovery import parse_advertisement_data, DeviceType
+from myolink.discovery import parse_manufacturer_data, DeviceType, OPEN_BIONICS_COMPANY_ID
 from myolink.device.hand import Hand, GripType
 
 # Configure logging
@@ -25,17 +20,29 @@ async def main():
     hand_ad_data = None
     logger.info("Scanning for Open Bionics Hands (OB2 Hand)...")
 
+    # Addresses already found not to be an OB2 Hand, skipped on re-advertisement
+    rejected_addresses = set()
+
     async with BleakScanner(detection_callback=None) as scanner:
         async for device, ad_data in scanner.advertisement_data():
-            parsed_ad = parse_advertisement_data(ad_data)
+            if device.address in rejected_addresses:
+                continue
+
+            # Only OB devices carry our Company ID, skip everything else before parsing
+            mfg_data = ad_data.manufacturer_data.get(OPEN_BIONICS_COMPANY_ID)
+            if mfg_data is None:
+                continue
+
+            # Each address is parsed at most once, it either ends the scan or is rejected below
+            parsed_ad = parse_manufacturer_data(bytes(mfg_data))
 
             if parsed_ad:
-                # Log discovered OB devices
+                # Log discovered OB devices (%-style so the message is only built if DEBUG is enabled)
                 dev_type = parsed_ad.device_config.device_type
-                chirality = parsed_ad.device_config.chirality
                 batt = parsed_ad.battery_level
-                logger.debug(f"Found OB Device: {device.address} ({device.name}) - "
-                             f"Type: {dev_type.name}, Chirality: {chirality.name}, Batt: {batt}%")
+                logger.debug("Found OB Device: %s (%s) - Type: %s, Chirality: %s, Batt: %d%%",
+                             device.address, device.name, dev_type.name,
+                             parsed_ad.device_config.chirality.name, batt)
 
                 # Check if it's an OB2 Hand
                 if DeviceType.OB2_HAND == dev_type:
@@ -45,6 +52,8 @@ async def main():
                     hand_ad_data = parsed_ad
                     break # Stop scanning once a hand is found
 
+            rejected_addresses.add(device.address)
+
     if hand_device is None:
         logger.error("No suitable OB2 Hand found.")
         return
@@ -63,6 +72,8 @@ async def main():
 
         logger.info("Connected successfully.")
         hand = Hand(client)
+        # Resolve the control characteristic once rather than on every write
+        hand.resolve_control_characteristic()
 
         try:
             logger.info("Setting position for Thumb and Index finger...")
@@ -2,38 +2,98 @@
 
 import asyncio
 import logging
-import sys
-import os
+import threading
 import time # Added
 
-# Add project root to path if running script directly
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 
 from bleak import BleakClient
 
-from myolink import discover_devices, DeviceType, Hand, GripType # type: ignore
+from myolink import discover_devices_iter, DeviceType, Hand, GripType # type: ignore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Window in which queued position updates are merged into a single write
+COALESCE_WINDOW_S = 0.02
+
+async def digit_position_writer(hand: Hand, position_queue: asyncio.Queue):
+	"""Sends queued digit positions to the hand, coalescing bursts of updates.
+
+	Updates arriving within COALESCE_WINDOW_S of each other are merged, keeping only
+	the latest position per digit, so a burst of N updates becomes a single write.
+	A None item on the queue stops the writer once any pending positions are sent.
+	"""
+	running = True
+	while running:
+		positions = await position_queue.get()
+		if positions is None:
+			break
+
+		while True:
+			try:
+				update = await asyncio.wait_for(position_queue.get(), timeout=COALESCE_WINDOW_S)
+			except asyncio.TimeoutError:
+				break
+			if update is None:
+				running = False
+				break
+			positions.update(update) # Latest value per digit wins
+
+		try:
+			await hand.set_digit_positions(positions)
+			logger.info(f"Sent positions: {positions}")
+		except Exception as cmd_e:
+			logger.error(f"Error sending command: {cmd_e}")
+
+def read_input(prompt: str) -> asyncio.Future:
+	"""Reads a line of input on a daemon thread, resolving the returned future with it.
+
+	A daemon thread rather than the loop's default executor, because asyncio.run waits for
+	that executor on shutdown and a thread blocked in input() would hang the exit after Ctrl+C.
+	"""
+	loop = asyncio.get_running_loop()
+	future = loop.create_future()
+
+	def resolve(result=None, error=None):
+		if future.done(): # Cancelled while waiting for input
+			return
+		if error is not None:
+			future.set_exception(error)
+		else:
+			future.set_result(result)
+
+	def worker():
+		try:
+			line = input(prompt)
+		except Exception as e: # EOFError when stdin is closed
+			loop.call_soon_threadsafe(resolve, None, e)
+		else:
+			loop.call_soon_threadsafe(resolve, line)
+
+	threading.Thread(target=worker, name="Input reader", daemon=True).start()
+	return future
+
 async def main():
 	hand_device = None
 	hand_ad_data = None
 	logger.info("Scanning for Open Bionics Hands (OB2 Hand)...")
 
-	# Use the core discover_devices, filtering for OB2_HAND
-	discovered_hands = await discover_devices(timeout=5.0, device_type=DeviceType.OB2_HAND)
+	# Stream discovered devices, filtering for OB2_HAND, and stop at the first hand found
+	hand_scan = discover_devices_iter(timeout=5.0, device_type=DeviceType.OB2_HAND)
+	try:
+		async for hand_device, hand_ad_data, rssi in hand_scan:
+			break
+	finally:
+		# Breaking out does not end the scan, close the generator so it stops before connecting
+		await hand_scan.aclose()
 
-	if not discovered_hands:
+	if hand_device is None:
 		logger.error("No OB2 Hand devices found.")
 		return
 
-	# Select the first discovered hand
-	first_hand_info = list(discovered_hands.values())[0]
-	hand_device, hand_ad_data, rssi = first_hand_info
-
 	logger.info(f"Found Hand: {hand_device.address} ({hand_device.name}), RSSI: {rssi}")
 	if hand_ad_data:
 		 logger.info(f"  Details: Schema={hand_ad_data.schema_version}, "
@@ -50,6 +110,12 @@ async def main():
 		logger.info("Connected successfully.")
 		# Instantiate Hand class with the connected client
 		hand = Hand(client)
+		# Resolve the control characteristic once rather than on every write
+		hand.resolve_control_characteristic()
+
+		# Positions are handed to a writer task so rapid updates share one BLE write
+		position_queue = asyncio.Queue()
+		writer_task = asyncio.create_task(digit_position_writer(hand, position_queue))
 
 		try:
 			logger.info("--- Interactive Digit Control ---")
@@ -59,42 +125,46 @@ async def main():
 			logger.info("Type 'q' or press Ctrl+C to quit.")
 
 			while True:
-				try:
-					user_input = input("\nEnter positions (or 'q' to quit): ").strip().lower()
-					if 'q' == user_input:
-						break
-
-					# Replace commas with spaces, then split
-					parts = user_input.replace(',', ' ').split()
-
-					# Allow 1 to 5 values
-					if not (1 <= len(parts) <= 5):
-						print("Invalid input: Please provide 1 to 5 space or comma-separated values.")
-						continue
-
-					try:
-						positions_list = [float(p) for p in parts]
-
-						# Convert list to dictionary {digit_id: position}
-						positions_dict = {i: pos for i, pos in enumerate(positions_list)}
-
-						await hand.set_digit_positions(positions_dict)
-						logger.info(f"Sent positions: {positions_dict}")
+				# Read input off the event loop so the writer task keeps running
+				user_input = await read_input("\nEnter positions (or 'q' to quit): ")
+				user_input = user_input.strip().lower()
+				if 'q' == user_input:
+					break
 
-					except ValueError:
-						print("Invalid input: Please ensure all values are valid numbers between 0.0 and 1.0.")
-						continue
-					except Exception as cmd_e:
-						logger.error(f"Error sending command: {cmd_e}")
-						continue # Allow user to try again
+				# Replace commas with spaces, then split
+				parts = user_input.replace(',', ' ').split()
 
-				except KeyboardInterrupt:
-					logger.info("\nLoop interrupted by user.")
-					break
+				# Allow 1 to 5 values
+				if not (1 <= len(parts) <= 5):
+					print("Invalid input: Please provide 1 to 5 space or comma-separated values.")
+					continue
 
+				# Convert and range check all values in one vectorised pass (also rejects NaN)
+				try:
+					positions_arr = np.asarray(parts, dtype=np.float64)
+				except ValueError:
+					positions_arr = None
+				if positions_arr is None or not ((positions_arr >= 0.0) & (positions_arr <= 1.0)).all():
+					print("Invalid input: Please ensure all values are valid numbers between 0.0 and 1.0.")
+					continue
+
+				# Convert array to dictionary {digit_id: position}
+				positions_dict = dict(enumerate(positions_arr.tolist()))
+				position_queue.put_nowait(positions_dict)
+
+			# Let the writer flush any pending positions before disconnecting
+			position_queue.put_nowait(None)
+			await writer_task
+
+		except asyncio.CancelledError:
+			# Ctrl+C cancels this task, the writer is cancelled and the hand disconnected on the way out
+			logger.info("Loop interrupted by user.")
+			raise
 		except Exception as e:
 			logger.error(f"An error occurred during hand control: {e}", exc_info=True)
 		finally:
+			if not writer_task.done():
+				writer_task.cancel()
 			logger.info("Disconnecting...")
 			# Disconnect happens automatically when exiting BleakClient context
 
@@ -1,26 +1,175 @@
 import asyncio
+import bisect
+import importlib.util
 import sys
+import threading
 import numpy as np
-from collections import deque
 import time
-from bleak import BleakClient, BleakError
-from myolink.core import discover_devices
-from myolink.discovery import DeviceType, Chirality
+from bleak import BleakClient, BleakError, BleakScanner
+from myolink.discovery import parse_advertisement_data, DeviceType, Chirality, OPEN_BIONICS_COMPANY_ID
 from myolink import MyoPod, EmgStreamSource, CompressionType
 from myolink.myopod import StreamDataPacket
 
 import pyqtgraph as pg
-from pyqtgraph.Qt import QtCore, QtWidgets
+from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 from qasync import QEventLoop, asyncSlot
-import functools
 
 # constants
 PLOT_DURATION_S = 10.0
-SAMPLE_RATE_HZ = 200
-BUFFER_SIZE = int(PLOT_DURATION_S * SAMPLE_RATE_HZ * 1.5)
+PLOT_DURATION_NS = int(PLOT_DURATION_S * 1_000_000_000)
+SAMPLE_RATE_HZ = 200 # Assumed stream rate until a device reports its own
+# 1.5x the visible window, rounded up to a power of two so ring indices wrap with a mask
+BUFFER_SIZE = 1 << (int(PLOT_DURATION_S * SAMPLE_RATE_HZ * 1.5) - 1).bit_length()
+# Age in sample periods of each buffered sample, oldest first, so the newest sits at 0
+SAMPLE_AGES = np.arange(-(BUFFER_SIZE - 1), 1, dtype=np.int64)
 MAX_DEVICES = 4 # Max devices to connect simultaneously
+DEVICE_LIST_UPDATE_DELAY_MS = 100 # Device list refresh requests within this window share one update
+SCAN_LIST_UPDATE_DELAY_MS = 1000 # Longer window for scan-driven refreshes, RSSI is too noisy to track faster
+MAX_CONCURRENT_CONNECTS = 2 # Connection handshakes in flight at once (many BLE adapters serialise beyond this)
+PLOT_INTERVAL_MS = 100 # Base plot refresh interval
+MAX_PLOT_INTERVAL_MS = 500 # Slowest the plot refresh backs off to when draws are expensive
+DEVICE_TIMEOUT_S = 6.0 # Devices not seen advertising for this long are dropped from the list (unless connected)
 # Revert to explicit colour list
 PLOT_COLOURS = ['#0085ca', '#ff991b', '#7ac943', '#8a3ffc'] # Blue, Orange, Green, Purple
+BLACK_BRUSH = QtGui.QBrush(pg.mkColor('k')) # Default device list text colour
+
+class RingBuffer:
+	"""Fixed-size circular buffer of samples backed by preallocated NumPy arrays.
+
+	The stream is uniformly spaced, so no per-sample timestamps are kept. Samples are plotted
+	against a fixed x-axis, in seconds before the newest sample, rebuilt only when the sample
+	period changes.
+
+	Every sample is written twice, at `i` and `i + size` (a mirrored "ghost" region), so the
+	newest `size` samples are always one contiguous slice and reading never copies.
+	"""
+	def __init__(self, size):
+		if size & (size - 1):
+			raise ValueError(f"RingBuffer size must be a power of two, got {size}")
+		self.size = size
+		self.mask = size - 1
+		self.y = np.empty(2 * size, dtype=np.float32)
+		self.x_axis = np.empty(size, dtype=np.float64) # Time of each slot relative to the newest sample
+		self.sample_period_ns = 1_000_000_000 // SAMPLE_RATE_HZ # Set from the device's stream rate
+		self.head = 0 # Index the next sample is written to
+		self.count = 0 # Number of valid samples held
+
+	def __len__(self):
+		return self.count
+
+	@property
+	def sample_period_ns(self):
+		return self._sample_period_ns
+
+	@sample_period_ns.setter
+	def sample_period_ns(self, period_ns):
+		self._sample_period_ns = period_ns
+		np.multiply(SAMPLE_AGES[-self.size:], period_ns * 1e-9, out=self.x_axis)
+
+	def _write(self, start, values):
+		"""Writes a batch that does not wrap, into both the primary and mirrored regions."""
+		end = start + len(values)
+		self.y[start:end] = values
+		self.y[start + self.size:end + self.size] = values
+
+	def push(self, values):
+		"""Appends a batch of samples, overwriting the oldest once full."""
+		values = np.asarray(values, dtype=np.float32)
+		n = len(values)
+		if n >= self.size:
+			# Batch fills the whole buffer, only the newest samples are kept
+			self._write(0, values[-self.size:])
+			self.head = 0
+			self.count = self.size
+			return
+		end = self.head + n
+		if end <= self.size:
+			self._write(self.head, values)
+		else:
+			# Wrap around: fill to the end of the primary region, then continue from the start
+			split = self.size - self.head
+			self._write(self.head, values[:split])
+			self._write(0, values[split:])
+		self.head = end & self.mask
+		self.count = min(self.count + n, self.size)
+
+	def snapshot(self, n=None):
+		"""Returns the newest `n` (default all) (seconds before the newest sample, values) oldest first, as views."""
+		n = self.count if n is None else min(n, self.count)
+		# Until the buffer first fills, samples sit at [0, head). After that the newest `size`
+		# samples always end at head + size in the mirrored region.
+		end = self.head if self.count < self.size else self.head + self.size
+		return self.x_axis[self.size - n:], self.y[end - n:end]
+
+	def clear(self):
+		self.head = 0
+		self.count = 0
+
+class SPSCRing:
+	"""Lock-free single-producer/single-consumer ring of float32 samples for the BLE -> GUI handoff.
+
+	The producer never waits: once the ring is full, new samples overwrite the oldest unread ones,
+	as a live plot wants the newest data. The producer advances `reserved` before copying and `head`
+	after, so the consumer can tell which part of a read may have been overwritten mid-copy and
+	discard it. Plain int reads and writes are atomic under the GIL, so no lock is needed.
+	"""
+	def __init__(self, size):
+		if size & (size - 1):
+			raise ValueError(f"SPSCRing size must be a power of two, got {size}")
+		self.size = size
+		self.mask = size - 1
+		self.buf = np.empty(size, dtype=np.float32)
+		self.head = 0 # Total samples written (producer only)
+		self.reserved = 0 # Total samples written or being written (producer only)
+		self.tail = 0 # Total samples read (consumer only)
+		self.dropped = 0 # Samples overwritten before they were read (consumer only)
+
+	def push(self, values):
+		"""Copies a batch of samples in (producer side), overwriting the oldest unread samples if full."""
+		values = np.asarray(values, dtype=np.float32)
+		n = len(values)
+		if 0 == n:
+			return
+		if n > self.size:
+			# Only the newest samples fit, the rest count as overwritten
+			values = values[-self.size:]
+		end_total = self.head + n
+		self.reserved = end_total # Announce the overwrite before it starts
+		start = (end_total - len(values)) & self.mask
+		end = start + len(values)
+		if end <= self.size:
+			self.buf[start:end] = values
+		else:
+			split = self.size - start
+			self.buf[start:] = values[:split]
+			self.buf[:end - self.size] = values[split:]
+		self.head = end_total # Publish only once the data is in place
+
+	def pending(self):
+		"""Returns how many samples are waiting to be read (consumer side)."""
+		return self.head - self.tail
+
+	def pop_all(self):
+		"""Returns every unread sample that is still intact as a new array (consumer side)."""
+		head = self.head
+		tail = max(self.tail, head - self.size) # Skip samples already overwritten
+		self.dropped += tail - self.tail
+		self.tail = head
+		n = head - tail
+		if 0 == n:
+			return self.buf[:0]
+		start = tail & self.mask
+		end = start + n
+		if end <= self.size:
+			values = self.buf[start:end].copy()
+		else:
+			values = np.concatenate((self.buf[start:], self.buf[:end - self.size]))
+		# The producer may have overwritten the oldest part of the copy while it was taken
+		lost = min(n, self.reserved - self.size - tail)
+		if lost > 0:
+			self.dropped += lost
+			values = values[lost:]
+		return values
 
 class MyoPodStreamer(QtWidgets.QWidget):
 	def __init__(self):
@@ -39,6 +188,10 @@ class MyoPodStreamer(QtWidgets.QWidget):
 		# Device List
 		sidebar_layout.addWidget(QtWidgets.QLabel("Discovered Devices:"))
 		self.device_list_widget = QtWidgets.QListWidget()
+		# Fonts shared by every list item, so restyling an item never builds a new QFont
+		self._regular_font = QtGui.QFont(self.device_list_widget.font())
+		self._bold_font = QtGui.QFont(self._regular_font)
+		self._bold_font.setBold(True)
 		sidebar_layout.addWidget(self.device_list_widget)
 
 		# Connection Button
@@ -91,13 +244,20 @@ class MyoPodStreamer(QtWidgets.QWidget):
 
 		# --- plot area (Keep for now) ---
 		self.plot_widget = pg.GraphicsLayoutWidget()
+		# Software rendering: let Qt repaint just the bounding region of what changed. An OpenGL
+		# viewport always redraws in full, so the mode is left alone there.
+		if not pg.getConfigOption('useOpenGL'):
+			self.plot_widget.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
 		self.plot = self.plot_widget.addPlot(title="EMG Signal")
 		self.plot.setLabel('left', "EMG Reading")
 		self.plot.setLabel('bottom', "Time (s)")
 		self.plot.setXRange(-PLOT_DURATION_S, 0)
+		# The x-axis is always the last PLOT_DURATION_S, so only allow panning and zooming in y.
+		# This also stops a zoom out in x from defeating the clip-to-view and downsampling below.
+		self.plot.setMouseEnabled(x=False, y=True)
 		# Enable performance optimisations
 		self.plot.setClipToView(True)
-		self.plot.setDownsampling(mode='peak')
+		self.plot.setDownsampling(auto=True, mode='peak')
 		# Set initial Y range to small values to see zero-line
 		self.plot.setYRange(-0.1, 0.1)
 		# Enable auto range on Y axis
@@ -120,16 +280,54 @@ class MyoPodStreamer(QtWidgets.QWidget):
 
 		# --- Data Structures (Revised) ---
 		self.discovered_devices = {} # address -> (BLEDevice, parsed_ad, rssi, last_seen)
-		self.connected_devices = {} # address -> dict {client, myopod, data_deque, timestamp_deque, curve, colour, native_rate, conv_factor, streaming, notification_queue}
+		self.connected_devices = {} # address -> dict {client, myopod, rx_ring, notification_handler, ring_buffer, curve, colour, brush, native_rate, conv_factor, streaming}
+		self._list_items = {} # address -> QListWidgetItem currently shown in the device list
+		self._list_item_connected = {} # address -> connection status the list item was last styled for
+		self._connect_btn_text = self.connect_selected_btn.text() # Last text set on the connect button
+		self._sorted_list_addresses = [] # Addresses in list order, for sorted insertion
+		self._scanning_item = None # "Scanning..." placeholder, shown while no devices are known
+		# (address, rx_ring, ring_buffer, curve) per connected device, rebuilt on connect/disconnect.
+		# Per-device buffers rather than (MAX_DEVICES, N) arrays: devices are redrawn one per plot timer
+		# tick and each needs its own array for setData anyway, so there is nothing to vectorise across.
+		self._active_devices = []
+
+		# --- BLE Thread ---
+		# Bleak runs on its own asyncio loop and thread so notifications are never held up by Qt painting.
+		# Samples are handed to the GUI thread through each device's SPSCRing.
+		self.gui_loop = asyncio.get_event_loop() # qasync loop, for calls back from the BLE thread
+		self.ble_loop = asyncio.new_event_loop()
+		self.ble_thread = threading.Thread(target=self._run_ble_loop, name="BLE", daemon=True)
+		self.ble_thread.start()
 
 		# --- Timers (Keep relevant ones) ---
+		# Never redraw faster than the display can show
+		screen = QtWidgets.QApplication.primaryScreen()
+		refresh_hz = screen.refreshRate() if screen and screen.refreshRate() > 0 else 60.0
+		self.min_plot_interval_ms = max(PLOT_INTERVAL_MS, int(1000 / refresh_hz))
+		self.plot_interval_ms = self.min_plot_interval_ms
 		self.plot_timer = QtCore.QTimer()
+		self.frame_timer = QtCore.QElapsedTimer() # Measures each plot update for adapt_plot_interval
+		self._plot_slot = -1 # Index into _active_devices of the device last redrawn
 		self.plot_timer.timeout.connect(self.update_plot)
-		self.plot_timer.start(100)	# update frequency (100Hz)
-
-		self.scan_timer = QtCore.QTimer()
-		self.scan_timer.timeout.connect(lambda: asyncio.create_task(self.background_scan()))
-		self.scan_timer.start(300)
+		self.plot_timer.start(self.plot_interval_ms)	# ticks once per device per interval (10Hz by default)
+
+		self.device_list_timer = QtCore.QTimer()
+		self.device_list_timer.setSingleShot(True)
+		self.device_list_timer.timeout.connect(self.update_device_list)
+
+		# One scanner is left running on the BLE thread and reports advertisements as they arrive,
+		# instead of starting and stopping a scan session on every timer tick. It is paused while connected.
+		self.scanner = None # BleakScanner, created on the BLE thread when scanning first starts
+		self._scanning = False # Whether the scanner is wanted running, its start/stop may still be in flight
+		self._scan_control_task = None # Last start/stop request, each one waits for the previous to finish
+		self._scan_resumed_time = time.time() # Devices are given DEVICE_TIMEOUT_S from here to reappear
+		self._ignored_addresses = set() # Open Bionics devices that are not OB2 Sensors, never parsed again
+		QtCore.QTimer.singleShot(0, lambda: self.set_scanning(True))
+
+		# Devices that stop advertising are dropped from the list once a second
+		self.prune_timer = QtCore.QTimer()
+		self.prune_timer.timeout.connect(self.prune_discovered_devices)
+		self.prune_timer.start(1000)
 
 		# --- signals (Connect new widgets) ---
 		self.quit_btn.clicked.connect(self.close)
@@ -144,235 +342,291 @@ class MyoPodStreamer(QtWidgets.QWidget):
 		# Add paused state
 		self.is_paused = False
 
+		# Closing is deferred until devices are disconnected on the running event loop
+		self._closing = False
+		self._close_ready = False
+
 	def log(self, msg):
 		print(msg)
 
+	def _run_ble_loop(self):
+		"""Runs the BLE event loop (BLE thread only)."""
+		asyncio.set_event_loop(self.ble_loop)
+		self.ble_loop.run_forever()
+
+	def run_ble(self, coro):
+		"""Runs a BLE coroutine on the BLE thread, returning an awaitable for the Qt event loop."""
+		return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.ble_loop))
+
+	@staticmethod
+	async def _connect_client(ble_device, disconnected_callback):
+		"""Creates and connects a BleakClient (runs on the BLE thread)."""
+		client = BleakClient(ble_device, disconnected_callback=disconnected_callback)
+		await client.connect()
+		return client
+
+	def make_disconnected_callback(self, address):
+		"""Builds a BleakClient disconnected callback that reports the lost link to the GUI thread."""
+		def on_disconnected(client):
+			self.gui_loop.call_soon_threadsafe(self.on_link_lost, address)
+		return on_disconnected
+
+	def on_link_lost(self, address):
+		"""Marks a device whose link dropped as disconnected, then cleans it up."""
+		device_info = self.connected_devices.get(address)
+		if device_info is None:
+			return # Disconnected on purpose, already cleaned up
+		device_info['connected'] = False
+		device_info['streaming'] = False
+		self.log(f"Lost connection to {address}.")
+		asyncio.ensure_future(self.disconnect_device(address))
+
+	def _rebuild_active_devices(self):
+		"""Refreshes the per-device tuples iterated by update_plot. Call whenever connected_devices changes."""
+		self._active_devices = [
+			(address, info['rx_ring'], info['ring_buffer'], info['curve'])
+			for address, info in self.connected_devices.items()
+		]
+		self.apply_plot_timer_interval()
+
 	def update_plot(self):
-		"""Updates all active plot curves with new data from the queues."""
-		current_time = time.perf_counter()
-		
-		# Debug print connected devices at start of update
-		self.log(f"[DEBUG] Connected devices at start of update: {list(self.connected_devices.keys())}")
-		
-		# Make a copy of connected_devices to prevent modification during iteration
-		devices_to_process = dict(self.connected_devices)
-		
-		# Device data plotting
-		for address, device_info in devices_to_process.items():
-			self.log(f"[DEBUG] Processing device {address}")
-			
-			# Verify device is still connected
-			if address not in self.connected_devices:
-				self.log(f"[WARN] Device {address} was removed during processing")
-				continue
-				
-			notification_queue = device_info.get('notification_queue')
-			data_deque = device_info.get('data_deque')
-			timestamp_deque = device_info.get('timestamp_deque')
-			curve = device_info.get('curve')
-
-			# Log what components we have
-			components = {
-				'queue': notification_queue is not None,
-				'data_deque': data_deque is not None,
-				'timestamp_deque': timestamp_deque is not None,
-				'curve': curve is not None
-			}
-			self.log(f"[DEBUG] Device {address} components: {components}")
+		"""Redraws the next device's curve in turn.
 
-			if not all(components.values()):
-				self.log(f"[ERROR] Missing components for {address}: {components}")
-				continue
+		The plot timer ticks once per device per plot interval, so the setData calls for
+		several devices are spread across the interval instead of landing in a single frame.
+		"""
+		devices = self._active_devices
+		if not devices:
+			return
+		self.frame_timer.start()
+		self._plot_slot = (self._plot_slot + 1) % len(devices)
+		self.update_device_plot(*devices[self._plot_slot])
+		# Every device gets one slot per interval, so scale this slot up to a full interval's work
+		self.adapt_plot_interval(self.frame_timer.nsecsElapsed() / 1e6 * len(devices))
+
+	def update_device_plot(self, address, rx_ring, ring_buffer, curve):
+		"""Updates one device's plot curve with the samples received since its last update."""
+		# Nothing new arrived since the last update, skip the redundant redraw
+		if 0 == rx_ring.pending():
+			return
+		# Always drain the handoff ring, even when paused, so the BLE thread never runs out of space
+		dropped_before = rx_ring.dropped
+		values = rx_ring.pop_all()
+		# Only log when samples were lost, this runs inside the frame timed by adapt_plot_interval
+		if rx_ring.dropped > dropped_before:
+			self.log(f"[WARN] {address} - Dropped {rx_ring.dropped - dropped_before} samples ({rx_ring.dropped} total)")
+		if self.is_paused:
+			return
 
-			# Debug print current queue sizes
-			self.log(f"[QUEUE] {address} - Queue size: {notification_queue.qsize()}, Data deque size: {len(data_deque)}, Timestamp deque size: {len(timestamp_deque)}")
-
-			# Always process the queue to prevent overflow, even when paused
-			packets_processed = 0
-			while not notification_queue.empty():
-				try:
-					packet: StreamDataPacket = notification_queue.get_nowait()
-					if packet and packet.data_points:
-						num_points = len(packet.data_points)
-						time_step = 1.0 / SAMPLE_RATE_HZ
-						timestamps = [current_time - (num_points - i) * time_step for i in range(num_points)]
-						
-						# Only update deques if not paused
-						if not self.is_paused:
-							data_deque.extend(packet.data_points)
-							timestamp_deque.extend(timestamps)
-							packets_processed += 1
-							
-							self.log(f"[DEQUE] {address} - After extend: Data size={len(data_deque)}, Timestamp size={len(timestamp_deque)}")
-							
-							while len(data_deque) > BUFFER_SIZE:
-								data_deque.popleft()
-								timestamp_deque.popleft()
-							
-				except asyncio.QueueEmpty:
-					break
-				except Exception as e:
-					self.log(f"[ERROR] Error processing packet from queue for {address}: {e}")
-					break
+		# Push everything received since the last update in one batch
+		ring_buffer.push(values)
 
-			# Only update the plot if not paused and we have new data
-			if not self.is_paused and packets_processed > 0:
-				try:
-					x_data = list(timestamp_deque)
-					y_data = list(data_deque)
-					
-					if len(x_data) != len(y_data):
-						self.log(f"[ERROR] Data length mismatch: x={len(x_data)}, y={len(y_data)}")
-						continue
-						
-					if len(x_data) == 0:
-						self.log(f"[WARN] No data to plot for {address}")
-						continue
-					
-					x_data = [t - current_time for t in x_data]
-					
-					self.log(f"[PLOT] {address} plotting {len(y_data)} points.")
-					self.log(f"[PLOT] X range: [{min(x_data):.2f}, {max(x_data):.2f}]")
-					self.log(f"[PLOT] Y range: [{min(y_data):.2f}, {max(y_data):.2f}]")
-					
-					curve.setData(x_data, y_data)
-					self.log(f"[PLOT] Updated curve for {address}")
-					
-					self.plot.replot()
-					
-				except Exception as e:
-					self.log(f"[ERROR] Plot update failed for {address}: {e}")
-
-	async def background_scan(self):
-		"""Scans for devices and updates the shared discovery pool."""
 		try:
-			discovered = await discover_devices(timeout=0.2, device_type=DeviceType.OB2_SENSOR)
-			current_time = time.time()
-			newly_discovered = False
-			disappeared = False
-			
-			# Keep track of addresses seen in this scan
-			seen_in_scan = set(discovered.keys())
-
-			# Update the shared discovery pool with newly found or updated devices
-			for address, (ble_device, parsed_ad, rssi) in discovered.items():
-				if address not in self.discovered_devices:
-					self.log(f"Discovered: {address} | {ble_device.name} | RSSI: {rssi}")
-					newly_discovered = True
-				# Store device info along with last seen time
-				self.discovered_devices[address] = (ble_device, parsed_ad, rssi, current_time)
-				
-			# Remove devices from discovered_devices if not seen for >6s AND not connected
-			to_remove_from_discovered = []
-			for addr, (_, _, _, last_seen) in self.discovered_devices.items():
-				if current_time - last_seen > 6 and addr not in self.connected_devices:
-					to_remove_from_discovered.append(addr)
-					
-			for addr in to_remove_from_discovered:
-				if addr in self.discovered_devices:
-					self.log(f"Device {addr} disappeared from scan (and not connected). Removing from discovered list.")
-					self.discovered_devices.pop(addr)
-					disappeared = True # Flag that a device was removed
-			
-			# Update list widget if there was a discovery or disappearance of non-connected devices
-			# Also update if connection status might have changed (handled implicitly by update_device_list checking self.connected_devices)
-			# We need to check if any *visible* device info changed (RSSI, name etc.) or if the set of known devices changed.
-			# Let's simplify and just update if anything changed or connections exist.
-			if newly_discovered or disappeared or self.connected_devices:
-				self.update_device_list()
+			# The newest sample sits at t=0 on the fixed x-axis. Both arrays are views into buffers owned by
+			# ring_buffer, which the curve keeps referencing. That is safe without double-buffering, as
+			# they are only ever rewritten here, immediately before the setData call that replaces them.
+			# Only the samples inside the plotted window are handed over, the rest of the history is just headroom
+			visible_count = PLOT_DURATION_NS // ring_buffer.sample_period_ns + 1
+			x_data, y_data = ring_buffer.snapshot(visible_count)
 			
+			if 0 == len(x_data):
+				self.log(f"[WARN] No data to plot for {address}")
+				return
+
+			# Samples are always finite and contiguous, so pyqtgraph can skip its per-point checks.
+			# No explicit replot: Qt schedules the repaint itself.
+			curve.setData(x_data, y_data, connect='all', skipFiniteCheck=True)
 		except Exception as e:
-			self.log(f"[DEBUG] Scan error: {e}")
+			self.log(f"[ERROR] Plot update failed for {address}: {e}")
+
+	def apply_plot_timer_interval(self):
+		"""Sets the plot timer to tick once per connected device within the plot interval."""
+		self.plot_timer.setInterval(max(1, self.plot_interval_ms // max(1, len(self._active_devices))))
+
+	def adapt_plot_interval(self, frame_ms):
+		"""Backs the plot interval off when updates take too long, and recovers once they are cheap again."""
+		new_interval_ms = self.plot_interval_ms
+		if frame_ms > 0.5 * self.plot_interval_ms:
+			new_interval_ms = min(MAX_PLOT_INTERVAL_MS, int(self.plot_interval_ms * 1.5))
+		elif frame_ms < 0.25 * self.plot_interval_ms:
+			new_interval_ms = max(self.min_plot_interval_ms, int(self.plot_interval_ms / 1.5))
+		if new_interval_ms != self.plot_interval_ms:
+			self.log(f"[PLOT] Frame took {frame_ms:.1f}ms, plot interval {self.plot_interval_ms}ms -> {new_interval_ms}ms")
+			self.plot_interval_ms = new_interval_ms
+			self.apply_plot_timer_interval()
+
+	def set_scanning(self, active):
+		"""Starts or stops the background scanner. Requests are applied in order on the BLE thread."""
+		if active == self._scanning:
+			return
+		self._scanning = active
+		if active:
+			self._scan_resumed_time = time.time()
+		self._scan_control_task = asyncio.ensure_future(self._apply_scanning(self._scan_control_task, active))
+
+	async def _apply_scanning(self, previous_request, active):
+		"""Starts or stops the scanner once the previous start/stop request has finished."""
+		if previous_request is not None:
+			await asyncio.wait([previous_request])
+		try:
+			await self.run_ble(self._start_scanner() if active else self._stop_scanner())
+		except Exception as e:
+			self.log(f"[ERROR] Failed to {'start' if active else 'stop'} background scan: {e}")
+
+	async def _start_scanner(self):
+		"""Creates the scanner on first use and starts it (runs on the BLE thread)."""
+		if self.scanner is None:
+			self.scanner = BleakScanner(detection_callback=self._on_ble_advertisement)
+		await self.scanner.start()
+
+	async def _stop_scanner(self):
+		"""Stops the scanner (runs on the BLE thread)."""
+		if self.scanner is not None:
+			await self.scanner.stop()
+
+	def _on_ble_advertisement(self, device, advertisement_data):
+		"""Forwards Open Bionics advertisements to the GUI thread (BLE thread only)."""
+		# Most advertisements nearby are not ours, drop them before they cross threads
+		if OPEN_BIONICS_COMPANY_ID in advertisement_data.manufacturer_data:
+			self.gui_loop.call_soon_threadsafe(self.on_advertisement, device, advertisement_data)
+
+	def on_advertisement(self, device, advertisement_data):
+		"""Records OB2 Sensors in the shared discovery pool as their advertisements arrive."""
+		current_time = time.time()
+		known = self.discovered_devices.get(device.address)
+		# Known sensors re-advertise constantly, only parse their payload again if it changed (e.g. battery level)
+		if known is not None and known[1].raw_manufacturer_data == bytes(advertisement_data.manufacturer_data[OPEN_BIONICS_COMPANY_ID]):
+			parsed_ad = known[1]
+		elif device.address in self._ignored_addresses:
+			return
+		else:
+			parsed_ad = parse_advertisement_data(advertisement_data)
+			if parsed_ad is None or DeviceType.OB2_SENSOR != parsed_ad.device_config.device_type:
+				self._ignored_addresses.add(device.address)
+				return
+			if known is None:
+				self.log(f"Discovered: {device.address} | {device.name} | RSSI: {advertisement_data.rssi}")
+		self.discovered_devices[device.address] = (device, parsed_ad, advertisement_data.rssi, current_time)
+		# Refresh RSSI/battery shown in the list
+		self.schedule_device_list_update(DEVICE_LIST_UPDATE_DELAY_MS if known is None else SCAN_LIST_UPDATE_DELAY_MS)
+
+	def prune_discovered_devices(self):
+		"""Drops devices that have stopped advertising from the discovery pool, unless connected."""
+		# Nothing is seen while the scanner is paused, so nothing can be judged stale
+		if not self._scanning:
+			return
+		cutoff = time.time() - DEVICE_TIMEOUT_S
+		# Devices last seen before scanning resumed get DEVICE_TIMEOUT_S from the resume to reappear
+		if self._scan_resumed_time > cutoff:
+			return
+		stale = [
+			address for address, (_, _, _, last_seen) in self.discovered_devices.items()
+			if last_seen < cutoff and address not in self.connected_devices
+		]
+		for address in stale:
+			self.log(f"Device {address} disappeared from scan (and not connected). Removing from discovered list.")
+			del self.discovered_devices[address]
+		if stale:
+			self.schedule_device_list_update()
+
+	def schedule_device_list_update(self, delay_ms=DEVICE_LIST_UPDATE_DELAY_MS):
+		"""Requests a device list update within `delay_ms`, sharing one update with other pending requests."""
+		# A pending update that is due sooner already covers this request
+		if self.device_list_timer.isActive() and self.device_list_timer.remainingTime() <= delay_ms:
+			return
+		self.device_list_timer.start(delay_ms)
 
 	def update_device_list(self):
-		"""Populates the list widget with discovered devices and checkboxes."""
+		"""Syncs the list widget with discovered and connected devices.
+
+		Items are only added or removed when the set of known devices changes. Existing items
+		have their text and tooltip updated in place, and their check state, colour and font
+		are only touched when the connection status flips.
+		"""
 		self.device_list_widget.blockSignals(True) # Block signals during update
-		self.device_list_widget.clear()
 
 		# Combine addresses from discovered and connected devices
 		all_known_addresses = set(self.discovered_devices.keys()) | set(self.connected_devices.keys())
 
+		# Remove devices that are no longer known
+		for address in set(self._list_items) - all_known_addresses:
+			item = self._list_items.pop(address)
+			self._list_item_connected.pop(address, None)
+			self._sorted_list_addresses.remove(address)
+			self.device_list_widget.takeItem(self.device_list_widget.row(item))
+
 		if not all_known_addresses:
-			item = QtWidgets.QListWidgetItem("Scanning...")
-			item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsUserCheckable) # Not checkable
-			self.device_list_widget.addItem(item)
-		else:
-			# Sort devices by address for consistent order
-			sorted_addresses = sorted(list(all_known_addresses))
-			for address in sorted_addresses:
-				is_connected = address in self.connected_devices
-				is_discovered = address in self.discovered_devices
-				
-				label = f"{address}"
-				tooltip_text = f"Address: {address}"
-				name = "(unknown)"
-				chirality_str = "?"
-				rssi = "N/A"
-				battery = None
-				
-				# Get info preferably from discovered_devices if available
-				if is_discovered:
-					ble_device, parsed_ad, rssi_val, _ = self.discovered_devices[address]
-					name = ble_device.name or "(unknown)"
-					rssi = f"{rssi_val} dBm"
-					if parsed_ad:
-						chirality = parsed_ad.device_config.chirality
-						chirality_str = "Open" if Chirality.LEFT_OR_OPEN == chirality else "Close"
-						if hasattr(parsed_ad, 'battery_level'):
-							battery = parsed_ad.battery_level
-				elif is_connected:
-					# If connected but not discovered, use minimal info
-					label += " | (Connected, not advertising)"
-				else:
-					# Should not happen with combined set logic, but skip if it does
-					continue 
-
-				# Update label and tooltip with discovered info if available
-				label = f"{address} | {name} | {chirality_str}"
-				tooltip_text = f"Address: {address}\nName: {name}\nType: Sensor ({chirality_str})\nRSSI: {rssi}"
-				if battery is not None:
-					tooltip_text += f"\nBattery: {battery}%"
-				
-				# Add status to tooltip
-				if is_connected:
-					status = "Connected"
-					if not is_discovered:
-						status += " (Not Advertising)"
-						# Maybe dim the text or change icon slightly?
-					tooltip_text += f"\nStatus: {status}"
-				elif is_discovered:
-					tooltip_text += "\nStatus: Discovered"
-				# else: # Should be unreachable
-				# 	tooltip_text += "\nStatus: Unknown"
+			if self._scanning_item is None:
+				self._scanning_item = QtWidgets.QListWidgetItem("Scanning...")
+				self._scanning_item.setFlags(self._scanning_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsUserCheckable) # Not checkable
+				self.device_list_widget.addItem(self._scanning_item)
+		elif self._scanning_item is not None:
+			self.device_list_widget.takeItem(self.device_list_widget.row(self._scanning_item))
+			self._scanning_item = None
+
+		for address in all_known_addresses:
+			is_connected = address in self.connected_devices
+			is_discovered = address in self.discovered_devices
+
+			name = "(unknown)"
+			chirality_str = "?"
+			rssi = "N/A"
+			battery = None
+
+			# Get info preferably from discovered_devices if available
+			if is_discovered:
+				ble_device, parsed_ad, rssi_val, _ = self.discovered_devices[address]
+				name = ble_device.name or "(unknown)"
+				rssi = f"{rssi_val} dBm"
+				if parsed_ad:
+					chirality = parsed_ad.device_config.chirality
+					chirality_str = "Open" if Chirality.LEFT_OR_OPEN == chirality else "Close"
+					if hasattr(parsed_ad, 'battery_level'):
+						battery = parsed_ad.battery_level
+
+			label = f"{address} | {name} | {chirality_str}"
+			tooltip_text = f"Address: {address}\nName: {name}\nType: Sensor ({chirality_str})\nRSSI: {rssi}"
+			if battery is not None:
+				tooltip_text += f"\nBattery: {battery}%"
+
+			# Add status to tooltip
+			if is_connected:
+				status = "Connected"
+				if not is_discovered:
+					status += " (Not Advertising)"
+				tooltip_text += f"\nStatus: {status}"
+			else:
+				tooltip_text += "\nStatus: Discovered"
 
+			item = self._list_items.get(address)
+			if item is None:
 				item = QtWidgets.QListWidgetItem(label)
 				item.setData(QtCore.Qt.ItemDataRole.UserRole, address) # Store address
 				item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable) # Make checkable
-				item.setToolTip(tooltip_text) # Set the tooltip
-				
-				# Set check state based only on connection status now
-				if is_connected:
-					item.setCheckState(QtCore.Qt.CheckState.Checked)
-					# Change text colour to match plot
-					colour_str = self.connected_devices[address].get('colour', '#000000') # Default black if colour missing
-					try:
-						item.setForeground(pg.mkColor(colour_str)) # Use pg.mkColor for convenience
-					except Exception as e:
-						self.log(f"[WARN] Failed to set text color for {address}: {e}")
-						item.setForeground(pg.mkColor('k')) # Fallback to black
-				else:
-					item.setCheckState(QtCore.Qt.CheckState.Unchecked)
-					# Ensure default text colour if not connected
-					item.setForeground(pg.mkColor('k')) # Use pg.mkColor for black
-					
-				# Bold text if connected
-				if is_connected:
-					font = item.font()
-					font.setBold(True)
-					item.setFont(font)
-					
-				self.device_list_widget.addItem(item)
-		
+				# Insert in address order for a consistent layout
+				row = bisect.bisect(self._sorted_list_addresses, address)
+				self._sorted_list_addresses.insert(row, address)
+				self.device_list_widget.insertItem(row, item)
+				self._list_items[address] = item
+			elif item.text() != label:
+				item.setText(label)
+			if item.toolTip() != tooltip_text:
+				item.setToolTip(tooltip_text)
+
+			if self._list_item_connected.get(address) == is_connected:
+				continue
+			self._list_item_connected[address] = is_connected
+
+			# Check state, colour and bold text follow the connection status
+			item.setFont(self._bold_font if is_connected else self._regular_font)
+			if is_connected:
+				item.setCheckState(QtCore.Qt.CheckState.Checked)
+				# Change text colour to match plot
+				item.setForeground(self.connected_devices[address].get('brush', BLACK_BRUSH))
+			else:
+				item.setCheckState(QtCore.Qt.CheckState.Unchecked)
+				item.setForeground(BLACK_BRUSH)
+
 		self.device_list_widget.blockSignals(False) # Re-enable signals
 
 		# After updating the list, update the connect/disconnect button text
@@ -395,14 +649,14 @@ class MyoPodStreamer(QtWidgets.QWidget):
 				address = item.data(QtCore.Qt.ItemDataRole.UserRole)
 				if address:
 					checked_addresses.add(address)
-		if not checked_addresses:
-			self.connect_selected_btn.setText("Connect Selected")
-			return
-		all_connected = all(addr in self.connected_devices for addr in checked_addresses)
-		if all_connected:
-			self.connect_selected_btn.setText("Disconnect")
+		if checked_addresses and all(addr in self.connected_devices for addr in checked_addresses):
+			text = "Disconnect"
 		else:
-			self.connect_selected_btn.setText("Connect Selected")
+			text = "Connect Selected"
+		# Called on every list refresh and selection change, only touch the button when its text changes
+		if text != self._connect_btn_text:
+			self._connect_btn_text = text
+			self.connect_selected_btn.setText(text)
 
 	def on_connect_selected_btn_wrapper(self):
 		asyncio.create_task(self.on_connect_selected_btn())
@@ -433,12 +687,17 @@ class MyoPodStreamer(QtWidgets.QWidget):
 				return
 			to_connect = to_connect[:available_slots]
 			self.log(f"Connecting devices: {to_connect}")
-			connect_tasks = [self.connect_device(addr) for addr in to_connect]
+			# Overlap the handshakes, but bound them as some adapters fail with too many at once
+			connect_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)
+			async def connect_bounded(addr):
+				async with connect_semaphore:
+					await self.connect_device(addr)
+			connect_tasks = [connect_bounded(addr) for addr in to_connect]
 			await asyncio.gather(*connect_tasks, return_exceptions=True)
-		self.update_device_list()
+		self.schedule_device_list_update()
 
 	async def connect_device(self, address):
-		"""Connects to a single device, sets up stream, plot curve, and notification queue."""
+		"""Connects to a single device, sets up stream and plot curve."""
 		if address not in self.discovered_devices:
 			self.log(f"Error connecting to {address}: Not found in discovered devices.")
 			return
@@ -455,17 +714,16 @@ class MyoPodStreamer(QtWidgets.QWidget):
 		# --- Stop scanning timer if this is the first connection ---
 		if not self.connected_devices: # Check before adding the new device
 			self.log("First device connecting, stopping background scan.")
-			self.scan_timer.stop()
+			self.set_scanning(False)
 
 		try:
-			client = BleakClient(ble_device)
-			await client.connect()
+			client = await self.run_ble(self._connect_client(ble_device, self.make_disconnected_callback(address)))
 			if not client.is_connected:
 				self.log(f"Failed to connect to {address}")
 				# Restart scanning if connection failed and no other devices are connected
 				if not self.connected_devices:
 					self.log("Connection failed, restarting background scan.")
-					self.scan_timer.start(300)
+					self.set_scanning(True)
 				return
 
 			myopod = MyoPod(client)
@@ -474,26 +732,35 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			assigned_colour = PLOT_COLOURS[len(self.connected_devices) % len(PLOT_COLOURS)]
 			# Create pen directly from hex string
 			curve = self.plot.plot(pen=assigned_colour)
+			# Only draw what is on screen, decimated to roughly one peak pair per pixel.
+			# The visible window holds PLOT_DURATION_S * SAMPLE_RATE_HZ (2000) samples, about one per
+			# pixel, so decimating again as samples arrive would not cut the points drawn per frame.
+			curve.setDownsampling(auto=True, method='peak')
+			curve.setClipToView(True)
+			curve.setSkipFiniteCheck(True)
 			self.log(f"Assigned colour {assigned_colour} to {address}")
+			brush = QtGui.QBrush(pg.mkColor(assigned_colour)) # Device list text colour, built once
 
-			# --- Create Notification Queue ---
-			notification_queue = asyncio.Queue()
-
-			# --- Store Connection Info (including queue) ---
+			# --- Store Connection Info ---
+			rx_ring = SPSCRing(BUFFER_SIZE) # BLE thread -> GUI thread handoff
 			device_info = {
 				'client': client,
 				'myopod': myopod,
-				'data_deque': deque(maxlen=BUFFER_SIZE),  # Initialize deque
-				'timestamp_deque': deque(maxlen=BUFFER_SIZE),  # Initialize deque
+				'rx_ring': rx_ring,
+				'notification_handler': self.make_notification_handler(rx_ring),
+				'ring_buffer': RingBuffer(BUFFER_SIZE), # Plot history (GUI thread only)
 				'curve': curve,
 				'colour': assigned_colour,
+				'brush': brush,
 				'native_rate': SAMPLE_RATE_HZ, # Placeholder, updated later
 				'conv_factor': None,
-				'streaming': False,
-				'notification_queue': notification_queue
+				# Link and subscription state, kept here so the GUI never queries the BLE thread's objects
+				'connected': True, # Cleared by on_link_lost
+				'streaming': False
 			}
 			self.connected_devices[address] = device_info
-			self.log(f"[INIT] Created device info for {address} with empty deques")
+			self._rebuild_active_devices()
+			self.log(f"[INIT] Created device info for {address} with empty ring buffer")
 
 			# --- Apply Global Stream Config ---
 			# Read global config from UI
@@ -502,23 +769,21 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			avg_samples = self.avg_samples_spin.value()
 
 			self.log(f"[{address}] Configuring stream: {stream_type.name}, {compression.name}, avg={avg_samples}")
-			await myopod.configure_stream(
+			await self.run_ble(myopod.configure_stream(
 				stream_source=stream_type,
 				compression=compression,
 				average_samples=avg_samples
-			)
+			))
 
 			# --- Start Stream Notifications ---
-			bound_handler = functools.partial(self.notification_handler, address)
 			self.log(f"[{address}] Starting stream subscription...")
-			await myopod.start_stream(bound_handler)
+			await self.run_ble(myopod.start_stream(device_info['notification_handler']))
 			self.connected_devices[address]['streaming'] = True
 
 			# --- Read Initial Config from Device ---
 			try:
-				stream_conf = await myopod.read_stream_configuration()
-				self.connected_devices[address]['native_rate'] = stream_conf.native_sample_rate_hz
-				self.connected_devices[address]['conv_factor'] = stream_conf.conversion_factor
+				stream_conf = await self.run_ble(myopod.read_stream_configuration())
+				self.store_stream_configuration(address, stream_conf)
 				self.log(f"[{address}] Config read: native={stream_conf.native_sample_rate_hz}Hz, conv={stream_conf.conversion_factor:.4g}")
 			except Exception as e:
 				self.log(f"[{address}] Failed to read stream config after connect: {e}")
@@ -532,7 +797,18 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			self.log(f"Error during connection to {address}: {e}")
 			await self.handle_connection_failure(address)
 		finally:
-			self.update_device_list()
+			self.schedule_device_list_update()
+
+	def store_stream_configuration(self, address, stream_conf):
+		"""Records a device's stream configuration, and spaces its plotted samples at the effective stream rate."""
+		device_info = self.connected_devices[address]
+		device_info['native_rate'] = stream_conf.native_sample_rate_hz
+		device_info['conv_factor'] = stream_conf.conversion_factor
+		# One sample is streamed per `average_samples` captured at the native rate
+		if stream_conf.native_sample_rate_hz > 0:
+			device_info['ring_buffer'].sample_period_ns = (
+				1_000_000_000 * max(1, stream_conf.average_samples) // stream_conf.native_sample_rate_hz
+			)
 
 	async def handle_connection_failure(self, address):
 		"""Handles cleanup after a connection attempt fails."""
@@ -541,9 +817,9 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			await self.disconnect_device(address) # Use existing disconnect logic for cleanup
 		else:
 			# If it wasn't even added, just check if scanning needs restarting
-			if not self.connected_devices and not self.scan_timer.isActive():
+			if not self.connected_devices and not self._scanning:
 				self.log("Connection failed, restarting background scan.")
-				self.scan_timer.start(300)
+				self.set_scanning(True)
 
 	async def disconnect_device(self, address):
 		"""Disconnects a single device and cleans up resources."""
@@ -553,6 +829,7 @@ class MyoPodStreamer(QtWidgets.QWidget):
 
 		self.log(f"Disconnecting {address}...")
 		device_info = self.connected_devices.pop(address) # Remove from dict immediately
+		self._rebuild_active_devices()
 		myopod = device_info.get('myopod')
 		client = device_info.get('client')
 		curve = device_info.get('curve')
@@ -564,20 +841,19 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			except Exception as e:
 				self.log(f"[ERROR] Error removing plot curve: {e}")
 
-		# Stop stream and disconnect client
-		if myopod:
+		# Stop stream and disconnect client, unless the link has already dropped
+		if myopod and device_info['connected']:
 			try:
-				if myopod.is_subscribed:
-					await myopod.stop_stream()
+				if device_info['streaming']:
+					await self.run_ble(myopod.stop_stream())
 			except Exception as e:
 				self.log(f"[ERROR] Error stopping stream during disconnect: {e}")
 			# Clear MyoPod object
 			myopod = None # Redundant as we popped dict entry, but safe
 
-		if client:
+		if client and device_info['connected']:
 			try:
-				if client.is_connected:
-					await client.disconnect()
+				await self.run_ble(client.disconnect())
 			except Exception as e:
 				self.log(f"[ERROR] Error disconnecting client: {e}")
 			# Clear client object
@@ -585,31 +861,25 @@ class MyoPodStreamer(QtWidgets.QWidget):
 
 		self.log(f"Disconnect of {address} complete.")
 		# Restart scanning timer if this was the last connected device
-		if not self.connected_devices and not self.scan_timer.isActive():
+		if not self.connected_devices and not self._scanning and not self._closing:
 			self.log("Last device disconnected, restarting background scan.")
-			self.scan_timer.start(300)
+			self.set_scanning(True)
 
 		# Update UI list after disconnect is fully processed
-		self.update_device_list()
+		self.schedule_device_list_update()
 
-	def notification_handler(self, address, packet: StreamDataPacket):
-		"""Minimal handler: Puts received packet onto the device's queue."""
-		try:
-			if address in self.connected_devices:
-				# self.log(f"[NOTIFY] Received packet from {address}: {len(packet.data_points) if packet and packet.data_points else 'no'} points")
-				# self.log(f"[NOTIFY] First few values: {packet.data_points[:5] if packet and packet.data_points else 'none'}")
-				queue = self.connected_devices[address].get('notification_queue')
-				if queue:
-					queue.put_nowait(packet)
-					# self.log(f"[DEBUG] Queued packet for {address} (Points: {len(packet.data_points) if packet else 0})")
-				else:
-					self.log(f"[ERROR] No queue found for {address}")
-			else:
-				self.log(f"[ERROR] Received notification for unknown device: {address}")
-		except asyncio.QueueFull:
-			self.log(f"[WARN] Notification queue full for {address}. Discarding packet.")
-		except Exception as e:
-			self.log(f"[ERROR] Exception in notification_handler for {address}: {e}")
+	@staticmethod
+	def make_notification_handler(rx_ring: SPSCRing):
+		"""Builds a device's stream handler, bound directly to its handoff ring.
+
+		The handler runs on the BLE thread for every packet, so it only copies the samples in.
+		Packets arriving after disconnect land in a ring nothing drains, and are harmlessly dropped.
+		"""
+		push = rx_ring.push
+		def notification_handler(packet: StreamDataPacket):
+			if packet and packet.data_points:
+				push(packet.data_points)
+		return notification_handler
 
 	async def apply_global_stream_config(self):
 		"""Applies the global stream configuration to all connected devices sequentially."""
@@ -630,7 +900,7 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			if address in self.connected_devices: # Check if still connected
 				device_info = self.connected_devices[address]
 				myopod = device_info.get('myopod')
-				if myopod and myopod.is_connected:
+				if myopod and device_info['connected']:
 					self.log(f"Applying config to {address}...")
 					await self._apply_config_to_single_device(address, myopod, stream_type, compression, avg_samples)
 					await asyncio.sleep(0.1) # Small delay between devices
@@ -645,8 +915,8 @@ class MyoPodStreamer(QtWidgets.QWidget):
 		"""Helper to apply configuration and restart stream for one device."""
 		try:
 			# Stop stream if running
-			if myopod.is_subscribed:
-				await myopod.stop_stream()
+			if self.connected_devices[address]['streaming']:
+				await self.run_ble(myopod.stop_stream())
 				self.connected_devices[address]['streaming'] = False
 			
 			# Clear plot data for this device
@@ -654,22 +924,20 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			
 			# Configure stream on device
 			self.log(f"[{address}] Applying config: {stream_type.name}, {compression.name}, avg={avg_samples}")
-			await myopod.configure_stream(
+			await self.run_ble(myopod.configure_stream(
 				stream_source=stream_type,
 				compression=compression,
 				average_samples=avg_samples
-			)
+			))
 			
 			# Re-start stream subscription
-			bound_handler = functools.partial(self.notification_handler, address)
-			await myopod.start_stream(bound_handler)
+			await self.run_ble(myopod.start_stream(self.connected_devices[address]['notification_handler']))
 			self.connected_devices[address]['streaming'] = True
 			
 			# Re-read config to update local state (native rate, conv factor)
 			try:
-				stream_conf = await myopod.read_stream_configuration()
-				self.connected_devices[address]['native_rate'] = stream_conf.native_sample_rate_hz
-				self.connected_devices[address]['conv_factor'] = stream_conf.conversion_factor
+				stream_conf = await self.run_ble(myopod.read_stream_configuration())
+				self.store_stream_configuration(address, stream_conf)
 				self.log(f"[{address}] Config updated & re-read: native={stream_conf.native_sample_rate_hz}Hz, conv={stream_conf.conversion_factor:.4g}")
 			except Exception as e:
 				self.log(f"[{address}] Failed to re-read stream config after update: {e}")
@@ -680,10 +948,10 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			# await self.disconnect_device(address)
 
 	def clear_plot_data(self, address):
-		"""Clears plot data deques for a specific device."""
+		"""Clears the plot data ring buffer for a specific device."""
 		if address in self.connected_devices:
-			self.connected_devices[address]['data_deque'].clear()
-			self.connected_devices[address]['timestamp_deque'].clear()
+			self.connected_devices[address]['rx_ring'].pop_all() # Discard samples not yet plotted
+			self.connected_devices[address]['ring_buffer'].clear()
 			curve = self.connected_devices[address].get('curve')
 			if curve:
 				curve.setData([], []) # Also clear the visual curve
@@ -691,67 +959,56 @@ class MyoPodStreamer(QtWidgets.QWidget):
 			self.log(f"[WARN] Cannot clear plot data for unknown address: {address}")
 
 	def closeEvent(self, event):
-		"""Ensures proper cleanup of timers and connections on exit."""
+		"""Ensures proper cleanup of timers and connections on exit.
+
+		The first close is ignored while devices are disconnected on the running qasync loop,
+		then the window closes itself again once that has finished.
+		"""
+		if self._close_ready:
+			self.log("Accepting close event.")
+			event.accept()
+			return
+		event.ignore()
+		if self._closing:
+			return # Cleanup already under way
+		self._closing = True
+
 		self.log("Close event triggered. Stopping timers and disconnecting...")
 		# Stop all timers first
 		self.plot_timer.stop()
-		self.scan_timer.stop()
-		# Stop any other timers if they existed
-
-		# Get the existing qasync event loop
-		loop = asyncio.get_event_loop()
+		self.prune_timer.stop()
+		self.device_list_timer.stop()
+		self.set_scanning(False)
+		asyncio.ensure_future(self._async_close())
 
-		async def cleanup():
+	async def _async_close(self):
+		"""Disconnects every device, then stops the BLE thread and closes the window."""
+		try:
 			# Get addresses before iterating as disconnect modifies the dict
 			addresses_to_disconnect = list(self.connected_devices.keys())
 			if not addresses_to_disconnect:
 				self.log("No devices were connected.")
-				return
-				
-			self.log(f"Disconnecting {len(addresses_to_disconnect)} device(s) sequentially: {addresses_to_disconnect}")
-			# Disconnect sequentially
-			for addr in addresses_to_disconnect:
-				self.log(f"Disconnecting {addr}...")
-				try:
-					await self.disconnect_device(addr)
-					await asyncio.sleep(0.1) # Small delay between disconnects
-				except Exception as e:
-					self.log(f"Error during sequential disconnect of {addr}: {e}")
-			
-			self.log("Disconnect tasks finished.")
-
-		# Run the cleanup within the existing loop if it's running
-		if loop.is_running():
-			self.log("Event loop is running, scheduling cleanup.")
-			cleanup_future = asyncio.ensure_future(cleanup(), loop=loop)
-			
-			# Add a callback for logging/errors
-			def _cleanup_done(task):
-				try:
-					task.result() # Check for exceptions during cleanup
-					self.log("Async cleanup task completed successfully.")
-				except Exception as e:
-					self.log(f"Error during async cleanup task: {e}")
-				# finally: # Avoid stopping the main GUI loop here
-				# 	if loop.is_running():
-				# 		self.log("Stopping event loop after cleanup.")
-				# 		loop.stop()
-			
-			cleanup_future.add_done_callback(_cleanup_done)
-		else:
-			self.log("Event loop not running, attempting synchronous cleanup.")
-			# Attempt synchronous cleanup if loop isn't running (less ideal)
-			try:
-				sync_loop = asyncio.new_event_loop()
-				asyncio.set_event_loop(sync_loop)
-				sync_loop.run_until_complete(cleanup())
-				sync_loop.close()
-				asyncio.set_event_loop(loop) # Restore original loop context if needed
-			except RuntimeError as e:
-				self.log(f"Error during synchronous cleanup attempt: {e}")
-
-		self.log("Accepting close event.")
-		event.accept()
+			else:
+				self.log(f"Disconnecting {len(addresses_to_disconnect)} device(s) sequentially: {addresses_to_disconnect}")
+				# Disconnect sequentially
+				for addr in addresses_to_disconnect:
+					self.log(f"Disconnecting {addr}...")
+					try:
+						await self.disconnect_device(addr)
+						await asyncio.sleep(0.1) # Small delay between disconnects
+					except Exception as e:
+						self.log(f"Error during sequential disconnect of {addr}: {e}")
+				self.log("Disconnect tasks finished.")
+		except Exception as e:
+			self.log(f"Error during async cleanup task: {e}")
+		finally:
+			# Let the scanner stop before its loop does
+			if self._scan_control_task is not None:
+				await asyncio.wait([self._scan_control_task])
+			# BLE work is finished, stop the BLE thread's loop
+			self.ble_loop.call_soon_threadsafe(self.ble_loop.stop)
+			self._close_ready = True
+			self.close()
 
 	def toggle_pause(self):
 		"""Toggles the pause state of the graph."""
@@ -764,6 +1021,10 @@ class MyoPodStreamer(QtWidgets.QWidget):
 
 if __name__ == "__main__":
 	print("Starting application...")
+	# Render curves through OpenGL when PyOpenGL is available, otherwise stay on the software painter
+	use_opengl = importlib.util.find_spec("OpenGL") is not None
+	pg.setConfigOptions(useOpenGL=use_opengl, enableExperimental=use_opengl, antialias=False)
+	print(f"OpenGL rendering {'enabled' if use_opengl else 'unavailable (install PyOpenGL), using software rendering'}")
 	app = QtWidgets.QApplication(sys.argv)
 	loop = QEventLoop(app)
 	asyncio.set_event_loop(loop)
@@ -1,17 +1,17 @@
 """Example: Discover, connect to a Hand, and attempt to monitor a humidity characteristic."""
 
 import asyncio
+import atexit
 import logging
 import sys
 import os
+import queue
+import threading
 import time
 import datetime
-import csv
-import struct # Added for unpacking float
 from typing import List, Tuple, Optional, Dict
 
-# Add project root to path if running script directly
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import numpy as np
 
 from bleak import BleakClient, BleakError
 from bleak.backends.device import BLEDevice
@@ -38,7 +38,15 @@ except ImportError:
 
 READ_INTERVAL_SECONDS = 1.0  # How often to read humidity
 PLOT_MAX_POINTS = 1800       # Maximum number of data points to display on the plot
+PLOT_REFRESH_INTERVAL_MS = 33 # Plot redraw interval (~30 fps), however fast readings arrive
 CSV_OUTPUT_DIR = "humidity_readings" # Directory to save CSV files
+CSV_BATCH_ROWS = 50          # Rows buffered in memory before being written to the CSV file
+CSV_FLUSH_INTERVAL_S = 5.0   # Longest a row waits in memory before being written, however slowly readings arrive
+READING_QUEUE_SIZE = 64      # Readings waiting to be logged and plotted, the oldest is dropped when full
+# CSV rows are formatted straight to bytes. No field can contain a comma or quote, so no csv module quoting is needed.
+# Timestamps are seconds since the file was opened. The header is the same in every file, so readers can
+# select columns by name. The start time is in the filename, and logged to the millisecond.
+CSV_HEADER = 'Elapsed (s),RelativeHumidity (%),Temperature (°C)\r\n'.encode('utf-8')
 
 # --- Logging Configuration ---
 logging.basicConfig(level=logging.INFO,
@@ -46,14 +54,19 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger(__name__)
 
 # --- Global variables for plotting ---
-plot_widget: Optional[pg.PlotWidget] = None
-plot_curve: Optional[pg.PlotDataItem] = None
-humidity_data: List[float] = []
-time_data: List[float] = []
-start_time_monotonic: float = 0.0 # Renamed for clarity
+# Annotations are strings, so the module still imports (and runs headless) without pyqtgraph
+plot_widget: Optional['pg.PlotWidget'] = None
+plot_curve: Optional['pg.PlotDataItem'] = None
 # New globals for temperature
-plot_curve_temp: Optional[pg.PlotDataItem] = None
-temperature_data: List[float] = []
+plot_curve_temp: Optional['pg.PlotDataItem'] = None
+# Plot history ring: rows are time (s since the plot was set up), humidity and temperature. Every point is
+# written twice, at `i` and `i + PLOT_MAX_POINTS`, so the newest PLOT_MAX_POINTS are always one contiguous slice.
+# Times are stored rather than derived from the point index, as readings are skipped or delayed on a slow link.
+plot_data = np.empty((3, 2 * PLOT_MAX_POINTS), dtype=np.float64)
+plot_total: int = 0 # Number of points ever added, the next point is written to column plot_total % PLOT_MAX_POINTS
+plot_start_monotonic: float = 0.0 # time.monotonic() when the plot was set up
+plot_dirty: bool = False # Set when points were added since the last redraw
+plot_refresh_timer = None # QTimer redrawing the plot at PLOT_REFRESH_INTERVAL_MS
 
 # --- Plotting Functions (if pyqtgraph is available) ---
 app_instance = None # Global variable for QApplication
@@ -68,8 +81,8 @@ def ensure_qapp():
 	return app_instance
 
 def setup_plot():
-	global plot_widget, plot_curve, humidity_data, time_data, start_time_monotonic
-	global plot_curve_temp, temperature_data # Added temperature globals
+	global plot_widget, plot_curve, plot_total, plot_start_monotonic, plot_dirty, plot_refresh_timer
+	global plot_curve_temp # Added temperature globals
 
 	if not PYQTGRAPH_AVAILABLE:
 		logger.warning("Plotting is disabled as pyqtgraph/PyQt5 is not available.")
@@ -84,40 +97,116 @@ def setup_plot():
 	plot_widget.setLabel('bottom', 'Time (s)')
 	plot_widget.showGrid(x=True, y=True)
 	plot_widget.addLegend() # Add legend for multiple plots
+	# Only draw the points in view, decimated to roughly one peak pair per pixel.
+	# No skipFiniteCheck: failed readings are stored as NaN, so the finite check is needed.
+	plot_widget.setDownsampling(auto=True, mode='peak')
+	plot_widget.setClipToView(True)
 
 	plot_curve = plot_widget.plot(pen='y', name='Humidity (%)') # Yellow line for humidity
 	plot_curve_temp = plot_widget.plot(pen='r', name='Temperature (°C)') # Red line for temperature
 
-	humidity_data = []
-	temperature_data = [] # Initialize temperature data list
-	time_data = []
-	start_time_monotonic = time.monotonic()
+	plot_total = 0
+	plot_start_monotonic = time.monotonic()
+	plot_dirty = False
+
+	# Redraw on a fixed cadence, so a burst of readings costs one setData per curve
+	plot_refresh_timer = QtCore.QTimer()
+	plot_refresh_timer.timeout.connect(refresh_plot)
+	plot_refresh_timer.start(PLOT_REFRESH_INTERVAL_MS)
 
 	plot_widget.show()
 
 
-def update_plot(humidity_value: Optional[float], temperature_value: Optional[float]):
-	global plot_widget, plot_curve, humidity_data, time_data, plot_curve_temp, temperature_data
+def update_plot(read_monotonic: float, humidity_value: Optional[float], temperature_value: Optional[float]):
+	"""Adds a reading taken at time.monotonic() `read_monotonic` to the plot history. The plot itself is redrawn by refresh_plot."""
+	global plot_widget, plot_curve, plot_curve_temp, plot_total, plot_dirty
 
 	if not PYQTGRAPH_AVAILABLE or plot_curve is None or plot_curve_temp is None or plot_widget is None:
 		return
 
-	current_time_sec = time.monotonic() - start_time_monotonic
-	
-	# Append humidity or NaN if None
-	humidity_data.append(humidity_value if humidity_value is not None else float('nan'))
-	# Append temperature or NaN if None
-	temperature_data.append(temperature_value if temperature_value is not None else float('nan'))
-	time_data.append(current_time_sec)
+	# Overwrites the oldest point once full. NumPy stores a missing (None) reading as NaN when
+	# assigning to a float array, so no per-value check is needed.
+	point = (read_monotonic - plot_start_monotonic, humidity_value, temperature_value)
+	head = plot_total % PLOT_MAX_POINTS
+	plot_data[:, head] = point
+	plot_data[:, head + PLOT_MAX_POINTS] = point
+	plot_total += 1
+	plot_dirty = True
 
-	# Keep only the last PLOT_MAX_POINTS
-	if len(time_data) > PLOT_MAX_POINTS: # Use time_data length as reference
-		humidity_data.pop(0)
-		temperature_data.pop(0)
-		time_data.pop(0)
 
-	plot_curve.setData(time_data, humidity_data)
-	plot_curve_temp.setData(time_data, temperature_data)
+def refresh_plot():
+	"""Redraws both curves from the plot history, if any readings arrived since the last redraw."""
+	global plot_dirty
+
+	if not plot_dirty or plot_curve is None or plot_curve_temp is None:
+		return
+	plot_dirty = False
+
+	# Until the ring first fills, points sit at [0, head). After that the newest
+	# PLOT_MAX_POINTS always end at head + PLOT_MAX_POINTS in the mirrored region.
+	head = plot_total % PLOT_MAX_POINTS
+	count = min(plot_total, PLOT_MAX_POINTS)
+	end = head if plot_total < PLOT_MAX_POINTS else head + PLOT_MAX_POINTS
+	time_view, humidity_view, temperature_view = plot_data[:, end - count:end]
+	plot_curve.setData(time_view, humidity_view)
+	plot_curve_temp.setData(time_view, temperature_view)
+
+
+class CsvWriterThread(threading.Thread):
+	"""Writes preformatted CSV rows to a file from a background thread, so file I/O never runs on the event loop.
+
+	Rows are batched and written every CSV_BATCH_ROWS rows, or once the oldest unwritten row is
+	CSV_FLUSH_INTERVAL_S old. Closing writes anything still queued before the file is closed.
+	"""
+	def __init__(self, csv_file):
+		super().__init__(name="CSV writer", daemon=True)
+		self._file = csv_file
+		self._rows: queue.Queue = queue.Queue() # Row bytes, or None to stop
+
+	def write_row(self, row: bytes):
+		"""Queues a row to be written (any thread, never blocks)."""
+		self._rows.put_nowait(row)
+
+	def close(self, warn_after: float = 2.0):
+		"""Writes any queued rows, closes the file and waits for the thread to finish.
+
+		Keeps waiting if the writes take longer than `warn_after` seconds, logging a warning, as returning
+		early would leave the file open and the last rows unwritten.
+		"""
+		self._rows.put_nowait(None)
+		self.join(warn_after)
+		if self.is_alive():
+			logger.warning(f"CSV writer still writing after {warn_after}s, waiting for it to finish...")
+			self.join()
+
+	def _write_batch(self, batch: List[bytes]):
+		try:
+			self._file.write(b"".join(batch))
+			self._file.flush()
+		except OSError as e:
+			logger.error(f"Error writing to CSV: {e}")
+		batch.clear()
+
+	def run(self):
+		batch: List[bytes] = []
+		batch_deadline = 0.0 # When the oldest row in the batch must be written by
+		while True:
+			try:
+				# Sleep until the next row, or until the batch is due if there is one
+				row = self._rows.get(timeout=max(0.0, batch_deadline - time.monotonic()) if batch else None)
+			except queue.Empty:
+				self._write_batch(batch)
+				continue
+			if row is None:
+				break
+			if not batch:
+				batch_deadline = time.monotonic() + CSV_FLUSH_INTERVAL_S
+			batch.append(row)
+			if len(batch) >= CSV_BATCH_ROWS:
+				self._write_batch(batch)
+		if batch:
+			self._write_batch(batch)
+		self._file.close()
 
 
 class HumidityMonitor:
@@ -125,33 +214,16 @@ class HumidityMonitor:
 		self._client: Optional[BleakClient] = None
 		self._hand_device: Optional[BLEDevice] = None
 		self._hand_ad_data: Optional[ParsedAdvertisingData] = None
-		self._csv_writer: Optional[csv.writer] = None
-		self._csv_file = None # Type: Optional[IO[str]]
+		self._csv_writer: Optional[CsvWriterThread] = None
+		self._csv_start_monotonic = 0.0 # time.monotonic() when the CSV file was opened
 		self._monitoring_active = False
+		self._stopped = asyncio.Event() # Set when the hand disconnects or monitoring is stopped
 		self._read_task: Optional[asyncio.Task] = None
+		# Readings are handed to a consumer task, so CSV writes and plotting never delay the next BLE read
+		self._readings: asyncio.Queue = asyncio.Queue(maxsize=READING_QUEUE_SIZE)
+		self._consumer_task: Optional[asyncio.Task] = None
 		self._hand_object: Optional[Hand] = None # To store the Hand instance
 
-	async def _notification_handler(self, sender_handle: int, data: bytearray):
-		"""Handles incoming BLE notifications (if characteristic supports notify)."""
-		# This handler is primarily for humidity if direct characteristic notification is used.
-		# For temperature, we rely on the periodic read polling the Hand object.
-		humidity_value: Optional[float] = None
-		try:
-			# Standard Humidity characteristic is uint16, value is N * 0.01 percent
-			if len(data) == 2: # Assuming this is specific to a humidity characteristic
-				humidity_raw = struct.unpack("<H", data)[0] # uint16_t
-				humidity_value = float(humidity_raw) / 100.0 # Convert to percentage
-				logger.info(f"Received Humidity Notification: {humidity_value:.2f}%")
-				self._log_to_csv(humidity_value, None) # Log with None for temperature
-				if PYQTGRAPH_AVAILABLE:
-					update_plot(humidity_value, None) # Update plot with None for temperature
-			else:
-				logger.warning(f"Received unexpected data length from humidity char: {len(data)} bytes, data: {data.hex()}")
-		except struct.error:
-			logger.error(f"Could not unpack humidity data: {data.hex()}")
-		except Exception as e:
-			logger.error(f"Error in notification handler: {e}")
-
 	async def _read_sensor_data_periodically(self): # Renamed from _read_humidity_periodically
 		"""Periodically reads sensor data (humidity and temperature) characteristic."""
 		if self._client is None or not self._client.is_connected or self._hand_object is None:
@@ -159,85 +231,109 @@ class HumidityMonitor:
 			return
 
 		sensor_read_timeout = 4.5 # seconds, give ample time for device response
+		# Reads start on a fixed cadence, so the command round trip falls inside the interval instead of adding to it
+		loop = asyncio.get_running_loop()
+		next_read_time = loop.time()
 		while self._monitoring_active and self._client.is_connected:
 			humidity_value: Optional[float] = None
 			temperature_value: Optional[float] = None
 
-			# Read Humidity
+			# Read Humidity and Temperature. Both come back in one response, so a single command reads them.
 			try:
-				logger.debug(f"Attempting to get relative humidity via Hand class (timeout: {sensor_read_timeout}s)...")
-				humidity_value = await self._hand_object.get_relative_humidity(timeout=sensor_read_timeout)
+				logger.debug(f"Attempting to get humidity and temperature via Hand class (timeout: {sensor_read_timeout}s)...")
+				humidity_value, temperature_value = await self._hand_object.get_humidity_and_temperature(timeout=sensor_read_timeout)
 				if humidity_value is not None:
 					logger.info(f"Read Humidity: {humidity_value:.2f}%")
 				else:
 					logger.warning("Failed to get humidity or timed out (received None).")
-			except asyncio.TimeoutError:
-				logger.warning("Timeout explicitly caught from get_relative_humidity in periodic task.")
-			except BleakError as e:
-				logger.error(f"BleakError while getting humidity via Hand class: {e}")
-			except Exception as e: # Catch other unexpected errors for humidity
-				logger.error(f"Unexpected error getting humidity: {e}", exc_info=True)
-
-			# Read Temperature
-			try:
-				if hasattr(self._hand_object, 'get_temperature'):
-					logger.debug(f"Attempting to get temperature via Hand class (timeout: {sensor_read_timeout}s)...")
-					temperature_value = await self._hand_object.get_temperature(timeout=sensor_read_timeout) # Assumed method
-					if temperature_value is not None:
-						logger.info(f"Read Temperature: {temperature_value:.2f}°C")
-					else:
-						logger.warning("Failed to get temperature or timed out (received None).")
+				if temperature_value is not None:
+					logger.info(f"Read Temperature: {temperature_value:.2f}°C")
 				else:
-					logger.debug("Hand object does not have 'get_temperature' method. Skipping temperature reading.")
+					logger.warning("Failed to get temperature or timed out (received None).")
 			except asyncio.TimeoutError:
-				logger.warning("Timeout explicitly caught from get_temperature in periodic task.")
+				logger.warning("Timeout explicitly caught from get_humidity_and_temperature in periodic task.")
 			except BleakError as e:
-				logger.error(f"BleakError while getting temperature via Hand class: {e}")
-			except Exception as e: # Catch other unexpected errors for temperature
-				logger.error(f"Unexpected error getting temperature: {e}", exc_info=True)
-
+				logger.error(f"BleakError while getting humidity and temperature via Hand class: {e}")
+			except Exception as e: # Catch other unexpected errors
+				# Runs every cycle on a flaky link, so only format the traceback when debugging
+				logger.error("Unexpected error getting humidity and temperature: %r", e)
+				logger.debug("Traceback for the humidity and temperature read error:", exc_info=True)
 
 			# Log and Plot
-			if humidity_value is not None or temperature_value is not None: # Log if at least one value
-				self._log_to_csv(humidity_value, temperature_value)
-				if PYQTGRAPH_AVAILABLE:
-					update_plot(humidity_value, temperature_value)
+			self._queue_reading(humidity_value, temperature_value)
 			
-			await asyncio.sleep(READ_INTERVAL_SECONDS)
+			next_read_time += READ_INTERVAL_SECONDS
+			delay = next_read_time - loop.time()
+			if delay < 0:
+				# The read overran the interval, start the next one now rather than trying to catch up
+				next_read_time = loop.time()
+				delay = 0
+			await asyncio.sleep(delay)
+
+	def _queue_reading(self, humidity_value: Optional[float], temperature_value: Optional[float]):
+		"""Hands a reading to the consumer task without waiting, dropping the oldest queued reading if full.
+
+		The reading is timestamped here, so a backlog in the queue does not delay its logged time.
+		"""
+		# A reading with neither value would only log an empty row and plot nothing
+		if humidity_value is None and temperature_value is None:
+			return
+		if self._readings.full():
+			self._readings.get_nowait()
+			logger.warning("Reading queue full, dropped the oldest reading.")
+		self._readings.put_nowait((time.monotonic(), humidity_value, temperature_value))
+
+	def _handle_reading(self, read_monotonic: float, humidity_value: Optional[float], temperature_value: Optional[float]):
+		self._log_to_csv(read_monotonic, humidity_value, temperature_value)
+		if PYQTGRAPH_AVAILABLE:
+			update_plot(read_monotonic, humidity_value, temperature_value)
+
+	async def _consume_readings(self):
+		"""Logs and plots queued readings as they arrive."""
+		while True:
+			self._handle_reading(*await self._readings.get())
 
 	def _setup_csv(self):
-		if not os.path.exists(CSV_OUTPUT_DIR):
-			try:
-				os.makedirs(CSV_OUTPUT_DIR)
-			except OSError as e:
-				logger.error(f"Failed to create CSV directory {CSV_OUTPUT_DIR}: {e}")
-				return
+		try:
+			os.makedirs(CSV_OUTPUT_DIR, exist_ok=True)
+		except OSError as e:
+			logger.error(f"Failed to create CSV directory {CSV_OUTPUT_DIR}: {e}")
+			return
 
-		timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+		# Wall clock time is only read once here, rows are timestamped relative to it
+		start_time = datetime.datetime.now()
+		timestamp = start_time.strftime("%Y%m%d_%H%M%S")
 		hand_id_part = self._hand_device.address.replace(":", "").replace("-","") if self._hand_device else "unknown_hand"
 		filename = f"sensor_data_{hand_id_part}_{timestamp}.csv" # Changed filename
 		filepath = os.path.join(CSV_OUTPUT_DIR, filename)
 		
 		try:
-			self._csv_file = open(filepath, 'w', newline='', encoding='utf-8')
-			self._csv_writer = csv.writer(self._csv_file)
-			self._csv_writer.writerow(['Timestamp', 'RelativeHumidity (%)', 'Temperature (°C)']) # Added Temperature column
-			logger.info(f"Saving sensor readings to: {filepath}")
+			csv_file = open(filepath, 'wb', buffering=1 << 16)
+			self._csv_start_monotonic = time.monotonic()
+			csv_file.write(CSV_HEADER)
 		except IOError as e:
 			logger.error(f"Failed to open CSV file {filepath}: {e}")
-			self._csv_file = None
-			self._csv_writer = None
-
-	def _log_to_csv(self, humidity_value: Optional[float], temperature_value: Optional[float]):
-		if self._csv_writer and self._csv_file:
-			try:
-				timestamp = datetime.datetime.now().isoformat()
-				humidity_str = f"{humidity_value:.2f}" if humidity_value is not None else ""
-				temp_str = f"{temperature_value:.2f}" if temperature_value is not None else ""
-				self._csv_writer.writerow([timestamp, humidity_str, temp_str])
-				self._csv_file.flush() 
-			except IOError as e:
-				logger.error(f"Error writing to CSV: {e}")
+			return
+		self._csv_writer = CsvWriterThread(csv_file)
+		self._csv_writer.start()
+		# Rows are batched, so make sure buffered readings still reach the file on an unexpected exit
+		atexit.register(self._close_csv)
+		logger.info(f"Saving sensor readings to: {filepath} (elapsed times from {start_time.isoformat(timespec='milliseconds')})")
+
+	def _log_to_csv(self, read_monotonic: float, humidity_value: Optional[float], temperature_value: Optional[float]):
+		if self._csv_writer:
+			timestamp = b"%.3f" % (read_monotonic - self._csv_start_monotonic)
+			humidity_bytes = b"%.2f" % humidity_value if humidity_value is not None else b""
+			temp_bytes = b"%.2f" % temperature_value if temperature_value is not None else b""
+			self._csv_writer.write_row(b"%s,%s,%s\r\n" % (timestamp, humidity_bytes, temp_bytes))
+
+	def _close_csv(self):
+		"""Writes any queued rows, then closes the CSV file. Safe to call more than once."""
+		if self._csv_writer is None:
+			return
+		self._csv_writer.close()
+		self._csv_writer = None
+		atexit.unregister(self._close_csv)
 
 	async def start_monitoring(self):
 		logger.info("Scanning for Open Bionics Hands (OB2 Hand)...")
@@ -248,7 +344,7 @@ class HumidityMonitor:
 			logger.error("No OB2 Hand devices found.")
 			return False
 
-		first_hand_address = list(discovered_devices.keys())[0]
+		first_hand_address = next(iter(discovered_devices))
 		self._hand_device, self._hand_ad_data, rssi = discovered_devices[first_hand_address]
 
 		logger.info(f"Found Hand: {self._hand_device.address} ({self._hand_device.name}), RSSI: {rssi}dBm")
@@ -262,12 +358,12 @@ class HumidityMonitor:
 
 		logger.info(f"Connecting to {self._hand_device.address}...")
 		try:
-			self._client = BleakClient(self._hand_device)
+			self._client = BleakClient(self._hand_device, disconnected_callback=lambda client: self._stopped.set())
 			await self._client.connect()
 
 			if not self._client.is_connected:
 				logger.error(f"Failed to connect to {self._hand_device.address}")
-				if self._csv_file: self._csv_file.close()
+				self._close_csv()
 				return False
 
 			logger.info("Connected successfully.")
@@ -313,6 +409,7 @@ class HumidityMonitor:
 			
 			# Start the periodic read task which now uses hand.get_relative_humidity() and hand.get_temperature()
 			logger.info("Starting periodic task to call sensor reading methods.")
+			self._consumer_task = asyncio.create_task(self._consume_readings())
 			self._read_task = asyncio.create_task(self._read_sensor_data_periodically()) # Updated method name
 
 
@@ -320,22 +417,33 @@ class HumidityMonitor:
 
 		except BleakError as e:
 			logger.error(f"BleakError during connection/setup: {e}")
-			if self._csv_file: self._csv_file.close()
+			self._close_csv()
 			return False
 		except Exception as e:
 			logger.error(f"Unexpected error during connection/setup: {e}", exc_info=True)
-			if self._csv_file: self._csv_file.close()
+			self._close_csv()
 			return False
 
 
 	async def stop_monitoring(self):
 		self._monitoring_active = False
+		self._stopped.set()
 		if self._read_task and not self._read_task.done():
 			self._read_task.cancel()
 			try:
 				await self._read_task
 			except asyncio.CancelledError:
 				logger.info("Read task cancelled.")
+
+		if self._consumer_task and not self._consumer_task.done():
+			self._consumer_task.cancel()
+			try:
+				await self._consumer_task
+			except asyncio.CancelledError:
+				pass
+		# Log any readings the consumer had not reached yet
+		while not self._readings.empty():
+			self._handle_reading(*self._readings.get_nowait())
 		
 		if self._client and self._client.is_connected:
 			logger.info("Disconnecting from hand...")
@@ -359,8 +467,8 @@ class HumidityMonitor:
 			await self._client.disconnect()
 			logger.info("Disconnected.")
 		
-		if self._csv_file:
-			self._csv_file.close()
+		if self._csv_writer:
+			self._close_csv()
 			logger.info("CSV file closed.")
 
 async def async_main_wrapper():
@@ -381,11 +489,8 @@ async def async_main_wrapper():
 	try:
 		# Keep alive while monitoring, especially if using notifications
 		# The read_task itself has its own loop if used.
-		# If only notifications, this loop keeps the program running.
-		while monitor._monitoring_active and monitor._client and monitor._client.is_connected:
-			await asyncio.sleep(0.1) # General keep-alive and event processing
-			# if PYQTGRAPH_AVAILABLE and QtWidgets.QApplication.instance():
-			# 	QtWidgets.QApplication.instance().processEvents() # Process Qt events - qasync should handle this
+		# Sleeps without waking until the hand disconnects or monitoring is stopped.
+		await monitor._stopped.wait()
 		logger.info("Monitoring loop ended (e.g. disconnected or error in setup).")
 
 	except KeyboardInterrupt:
@@ -394,6 +499,8 @@ async def async_main_wrapper():
 		logger.info("Shutting down monitor...")
 		await monitor.stop_monitoring()
 		if PYQTGRAPH_AVAILABLE and QtWidgets.QApplication.instance():
+			if plot_refresh_timer:
+				plot_refresh_timer.stop()
 			# Ensure plot widget is closed if it exists and is visible
 			if plot_widget and plot_widget.isVisible():
 				plot_widget.close()
@@ -1,8 +1,6 @@
 import sys
 import time
 import asyncio
-import functools
-from collections import deque
 from typing import Dict, List
 import json
 import os.path
@@ -11,9 +9,8 @@ import numpy as np
 from PyQt6 import QtWidgets, QtCore, QtGui
 from qasync import QEventLoop
 
-from bleak import BleakClient, BleakError
-from myolink.core import discover_devices
-from myolink.discovery import DeviceType, Chirality
+from bleak import BleakClient, BleakError, BleakScanner
+from myolink.discovery import DeviceType, Chirality, parse_advertisement_data
 from myolink import MyoPod, EmgStreamSource, CompressionType
 from myolink.myopod import StreamDataPacket
 
@@ -22,6 +19,43 @@ MAX_DEVICES = 8  # Maximum number of supported devices
 SAMPLE_RATE_HZ = 500  # Default sample rate
 BUFFER_SIZE = 100  # Smaller buffer as we only need recent values
 UPDATE_RATE_HZ = 30  # Spider graph update rate
+IDLE_UPDATE_INTERVAL_MS = 200  # Spider update interval while no samples are arriving
+DEVICE_TIMEOUT_S = 10  # Devices not seen advertising for this long are dropped from the list
+
+class RecentSamples:
+    """Holds the most recent `size` samples in a preallocated NumPy circular buffer."""
+    def __init__(self, size):
+        self.size = size
+        self.buf = np.zeros(size, dtype=np.float32)
+        self.write_index = 0  # Index the next sample is written to
+        self.count = 0  # Number of valid samples held
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, values):
+        """Appends a batch of samples, overwriting the oldest once full."""
+        values = np.asarray(values, dtype=np.float32)
+        n = len(values)
+        if n >= self.size:
+            self.buf[:] = values[-self.size:]
+            self.write_index = 0
+            self.count = self.size
+            return
+        end = self.write_index + n
+        if end <= self.size:
+            self.buf[self.write_index:end] = values
+        else:
+            split = self.size - self.write_index
+            self.buf[self.write_index:] = values[:split]
+            self.buf[:end - self.size] = values[split:]
+        self.write_index = end % self.size
+        self.count = min(self.count + n, self.size)
+
+    def rms(self):
+        """Returns the RMS of the held samples. Sample order does not matter, so no reordering is needed."""
+        window = self.buf[:self.count]
+        return float(np.sqrt(np.dot(window, window) / self.count))
 
 class SpiderCanvas(QtWidgets.QWidget):
     def __init__(self, main_window):
@@ -34,6 +68,7 @@ class SpiderCanvas(QtWidgets.QWidget):
         self.device_angles = {}  # address -> angle in degrees
         self.max_magnitude = 1.0  # Auto-scales with data
         self.actions = []  # Initialize empty actions list
+        self.action_colors = []  # QColor per action, parsed once from the settings string
         
         # Drag state
         self.dragging_device = None
@@ -42,6 +77,7 @@ class SpiderCanvas(QtWidgets.QWidget):
     def set_actions(self, actions):
         """Update the action definitions."""
         self.actions = actions
+        self.action_colors = [QtGui.QColor(action['color']) for action in actions]
         self.update()
 
     def get_center_and_radius(self):
@@ -237,7 +273,7 @@ class SpiderCanvas(QtWidgets.QWidget):
                 y_offset += 20
 
         # Draw action regions first (behind everything else)
-        for action in self.actions:
+        for action, color in zip(self.actions, self.action_colors):
             # Create path for the angular segment
             path = QtGui.QPainterPath()
             path.moveTo(center)
@@ -259,7 +295,6 @@ class SpiderCanvas(QtWidgets.QWidget):
             path.lineTo(center)
             
             # Fill the region
-            color = QtGui.QColor(action['color'])
             painter.fillPath(path, color)
             
             # Draw the action name (using original angles since we want counterclockwise)
@@ -327,9 +362,16 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
         layout.addWidget(self.log_area)
         
         self.settings_file = "spider_myopod_settings.json"
-        self.discovered_devices = {}
+        self.discovered_devices = {}  # address -> (device, name, rssi)
+        # Last seen times are kept in a flat array, one slot per discovered address, so the
+        # eviction sweep is a single vectorised comparison
+        self._discovered_addresses = []
+        self._address_index = {}
+        self._ignored_addresses = set()  # Addresses whose advertisements are not OB2 Sensors, never parsed again
+        self._last_seen = np.empty(64, dtype=np.float64)
         self.connected_devices = {}
         self.connecting_devices = set()
+        self._device_list_entries = None  # (address, label) pairs currently shown in the device list
 
         # Device colors
         self.device_colors = [
@@ -346,14 +388,20 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
         # Load saved device settings
         self.load_settings()
 
-        # Start background scan timer
-        self.scan_timer = QtCore.QTimer()
-        self.scan_timer.timeout.connect(lambda: asyncio.create_task(self.background_scan()))
-        self.scan_timer.start(1000)  # Scan every second
+        # One scanner is left running and reports advertisements as they arrive, instead of
+        # starting a new discovery session every tick. It is started once the event loop runs.
+        self.scanner = BleakScanner(detection_callback=self.on_advertisement)
+        QtCore.QTimer.singleShot(0, lambda: asyncio.create_task(self.start_scanning()))
+
+        # Periodically drop devices that have stopped advertising
+        self.prune_timer = QtCore.QTimer()
+        self.prune_timer.timeout.connect(self.update_device_list)
+        self.prune_timer.start(1000)
 
         # Add auto-connect timer
         self.connect_timer = QtCore.QTimer()
-        self.connect_timer.timeout.connect(lambda: asyncio.create_task(self.try_auto_connect()))
+        self.connect_timer.timeout.connect(self.kick_auto_connect)
+        self._auto_connect_task = None  # Running try_auto_connect, so slow connects never stack up attempts
         self.connect_timer.start(2000)  # Try auto-connect every 2 seconds
 
         # Start update timer for spider graph
@@ -429,6 +477,12 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
         except Exception as e:
             self.log(f"Error saving settings: {e}")
 
+    def kick_auto_connect(self):
+        """Starts an auto-connect pass, unless the previous one is still running."""
+        if self._auto_connect_task is not None and not self._auto_connect_task.done():
+            return
+        self._auto_connect_task = asyncio.create_task(self.try_auto_connect())
+
     async def try_auto_connect(self):
         """Attempt to auto-connect to saved devices."""
         if not self.saved_devices:
@@ -442,18 +496,37 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
                 self.log(f"Auto-connecting to {device_info['name']}")
                 await self.connect_device(address)
 
-    async def background_scan(self):
-        """Background scan for discovering new devices."""
+    async def start_scanning(self):
+        """Starts the background scanner that feeds on_advertisement."""
         self.log("Starting background scan...")
         try:
-            devices = await discover_devices(device_type=DeviceType.OB2_SENSOR)
-            current_time = time.time()
-            for address, (device, parsed_ad, rssi) in devices.items():
-                if address not in self.discovered_devices:
-                    self.discovered_devices[address] = (device, device.name, rssi, current_time)
-                    self.update_device_list()
+            await self.scanner.start()
         except Exception as e:
-            self.log(f"Error during background scan: {e}")
+            self.log(f"Error starting background scan: {e}")
+
+    def on_advertisement(self, device, advertisement_data):
+        """Records OB2 Sensors as their advertisements arrive."""
+        # Known sensors re-advertise constantly, so check the address before paying the parsing cost
+        index = self._address_index.get(device.address)
+        if index is not None:
+            # Refresh last seen, keeping the RSSI shown when first discovered so the list stays stable
+            self._last_seen[index] = time.time()
+            return
+        if device.address in self._ignored_addresses:
+            return
+        parsed_ad = parse_advertisement_data(advertisement_data)
+        if parsed_ad is None or DeviceType.OB2_SENSOR != parsed_ad.device_config.device_type:
+            self._ignored_addresses.add(device.address)
+            return
+
+        index = len(self._discovered_addresses)
+        if index == len(self._last_seen):
+            self._last_seen = np.resize(self._last_seen, 2 * index)
+        self._last_seen[index] = time.time()
+        self._discovered_addresses.append(device.address)
+        self._address_index[device.address] = index
+        self.discovered_devices[device.address] = (device, device.name, advertisement_data.rssi)
+        self.update_device_list()
 
     def on_connect_button(self):
         """Handles the connect button click."""
@@ -522,7 +595,7 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
             self.log(f"Already attempting to connect to {address}")
             return
             
-        device, name, rssi, _ = self.discovered_devices[address]
+        device, name, rssi = self.discovered_devices[address]
         
         # Mark device as being connected to
         self.connecting_devices.add(address)
@@ -533,8 +606,7 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
             self.log(f"Connected to {name}")
             
             myopod = MyoPod(client)
-            data_deque = deque(maxlen=BUFFER_SIZE)
-            notification_queue = asyncio.Queue()
+            recent_samples = RecentSamples(BUFFER_SIZE)
             
             # Find saved settings for this device
             saved_angle = 0
@@ -549,8 +621,8 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
             self.connected_devices[address] = {
                 'client': client,
                 'myopod': myopod,
-                'data_deque': data_deque,
-                'notification_queue': notification_queue,
+                'recent_samples': recent_samples,
+                'pending_points': [],  # data_points of packets received since the last spider update
                 'name': name,
                 'angle': saved_angle,
                 'label': saved_label
@@ -572,8 +644,8 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
             )
             
             # Start stream with notification handler
-            bound_handler = functools.partial(self.notification_handler, address)
-            await myopod.start_stream(bound_handler)
+            handler = self.make_notification_handler(self.connected_devices[address]['pending_points'])
+            await myopod.start_stream(handler)
             
             self.update_device_list()
             self.spider_canvas.update()
@@ -591,52 +663,83 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
             # Always remove from connecting set when done
             self.connecting_devices.remove(address)
 
-    def notification_handler(self, address, packet: StreamDataPacket):
-        """Handles incoming EMG data packets."""
-        try:
-            if address in self.connected_devices:
-                device_info = self.connected_devices[address]
-                if packet and packet.data_points:
-                    device_info['data_deque'].extend(packet.data_points)
-        except Exception as e:
-            self.log(f"Error in notification handler: {e}")
+    @staticmethod
+    def make_notification_handler(pending_points: List):
+        """Builds a device's EMG packet handler, bound directly to its pending list.
+
+        The handler only queues each packet's samples for the next spider update. Errors in it
+        are already caught and logged by MyoPod.
+        """
+        append = pending_points.append
+        def notification_handler(packet: StreamDataPacket):
+            if packet and packet.data_points:
+                append(packet.data_points)
+        return notification_handler
 
     def update_spider(self):
-        """Updates the spider graph with latest EMG values."""
+        """Updates the spider graph with latest EMG values, repainting only if new samples arrived."""
+        data_arrived = False
         for address, device_info in self.connected_devices.items():
-            data_deque = device_info.get('data_deque')
-            if data_deque and len(data_deque) > 0:
-                # Calculate RMS of recent samples
-                recent_data = np.array(list(data_deque))
-                rms = np.sqrt(np.mean(np.square(recent_data)))
-                
-                # Update max magnitude if necessary
-                if rms > self.spider_canvas.max_magnitude:
-                    self.spider_canvas.max_magnitude = rms * 1.2  # Add 20% headroom
-                
-                # Update point
-                self.spider_canvas.points[address] = rms
-        
+            recent_samples = device_info.get('recent_samples')
+            pending_points = device_info.get('pending_points')
+            if not pending_points:
+                # No new samples, so this device's RMS is unchanged
+                continue
+            data_arrived = True
+
+            # Only the newest BUFFER_SIZE samples are kept, so skip whole packets older than that
+            keep_from = len(pending_points)
+            kept = 0
+            while keep_from > 0 and kept < BUFFER_SIZE:
+                keep_from -= 1
+                kept += len(pending_points[keep_from])
+            recent_samples.extend(np.concatenate(pending_points[keep_from:]))
+            pending_points.clear()
+
+            # Calculate RMS of recent samples
+            rms = recent_samples.rms()
+            
+            # Update max magnitude if necessary
+            if rms > self.spider_canvas.max_magnitude:
+                self.spider_canvas.max_magnitude = rms * 1.2  # Add 20% headroom
+            
+            # Update point
+            self.spider_canvas.points[address] = rms
+
+        # Poll slowly while no data is arriving, and return to the full rate as soon as it does
+        interval_ms = 1000 // UPDATE_RATE_HZ if data_arrived else IDLE_UPDATE_INTERVAL_MS
+        if self.update_timer.interval() != interval_ms:
+            self.update_timer.setInterval(interval_ms)
+
         # Trigger repaint
-        self.spider_canvas.update()
+        if data_arrived:
+            self.spider_canvas.update()
 
     def update_device_list(self):
-        self.device_list_widget.clear()
-        current_time = time.time()
-        
-        # First remove old devices
-        addresses_to_remove = []
-        for address, (_, _, _, last_seen) in self.discovered_devices.items():
-            if current_time - last_seen > 10:
-                addresses_to_remove.append(address)
-        
-        for address in addresses_to_remove:
-            del self.discovered_devices[address]
-        
-        # Update the list
-        for address, (device, name, rssi, last_seen) in self.discovered_devices.items():
+        # First remove old devices, compacting the survivors to the front of the last seen array
+        count = len(self._discovered_addresses)
+        stale = (time.time() - self._last_seen[:count]) > DEVICE_TIMEOUT_S
+        if stale.any():
+            for index in np.flatnonzero(stale):
+                del self.discovered_devices[self._discovered_addresses[index]]
+            keep = np.flatnonzero(~stale)
+            self._last_seen[:len(keep)] = self._last_seen[keep]
+            self._discovered_addresses = [self._discovered_addresses[index] for index in keep]
+            self._address_index = {address: index for index, address in enumerate(self._discovered_addresses)}
+
+        # Build the item labels, and skip the rebuild (which also drops the selection) if nothing shown changed
+        entries = []
+        for address, (device, name, rssi) in self.discovered_devices.items():
             status = "Connected" if address in self.connected_devices else "Available"
-            item = QtWidgets.QListWidgetItem(f"{name} ({status}) RSSI: {rssi}")
+            entries.append((address, f"{name} ({status}) RSSI: {rssi}"))
+        if entries == self._device_list_entries:
+            return
+        self._device_list_entries = entries
+
+        # Update the list
+        self.device_list_widget.clear()
+        for address, label in entries:
+            item = QtWidgets.QListWidgetItem(label)
             item.setData(QtCore.Qt.ItemDataRole.UserRole, address)
             self.device_list_widget.addItem(item)
             
@@ -688,6 +791,9 @@ class SpiderMyoPod(QtWidgets.QMainWindow):
         """Handle application closing."""
         self.log("Saving settings before exit...")
         self.save_settings()
+
+        self.prune_timer.stop()
+        asyncio.create_task(self.scanner.stop())
         
         # Disconnect all devices
         for address in list(self.connected_devices.keys()):
@@ -2,13 +2,14 @@
 
 __version__ = "0.0.1"
 
-from .core import discover_devices
+from .core import discover_devices, discover_devices_iter
 # Import other core components, MyoPod as they are created 
 
 from .device.hand import Hand, GripType
 from .myopod import MyoPod, EmgStreamSource, CompressionType, StreamDataPacket
 from .discovery import (
     parse_advertisement_data,
+    parse_manufacturer_data,
     ParsedAdvertisingData,
     DeviceConfig,
     DeviceType,
@@ -25,10 +26,11 @@ from .discovery import (
 
 # Optional: Define __all__ for cleaner imports from the package level
 __all__ = [
+    'discover_devices', 'discover_devices_iter',
     'Hand', 'GripType',
     'MyoPod', 'EmgStreamSource', 'CompressionType', 'StreamDataPacket',
     # Discovery exports
-    'parse_advertisement_data', 'ParsedAdvertisingData', 'DeviceConfig',
+    'parse_advertisement_data', 'parse_manufacturer_data', 'ParsedAdvertisingData', 'DeviceConfig',
     'DeviceType', 'Chirality', 'HandSpecificData', 'HandClass', 'HandSize',
     'SensorSpecificDataV1', 'SensorSpecificDataV2', 'SensorSpecificDataV3',
     'SensorType', 'SensorAdvertisingReason'
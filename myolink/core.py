@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
@@ -87,6 +87,56 @@ async def discover_devices(
 	logger.info(f"Scan finished. Found {len(devices_found)} matching Open Bionics devices.")
 	return devices_found
 
+async def discover_devices_iter(
+	timeout: float = 5.0,
+	device_type: Optional[DeviceType] = None
+) -> AsyncIterator[Tuple[BLEDevice, ParsedAdvertisingData, int]]:
+	"""Scans for Open Bionics devices, yielding each one as soon as it is found.
+
+	Unlike discover_devices, nothing is collected up front, so callers looking for
+	a single device can stop at the first match. Call aclose() on the generator after
+	breaking out of the loop, so the scan stops straight away rather than on garbage collection.
+
+	Args:
+		timeout: Maximum scanning duration in seconds.
+		device_type: Optional filter to yield only devices of a specific type (e.g., DeviceType.OB2_HAND).
+
+	Yields:
+		Tuples containing the BLEDevice object, the ParsedAdvertisingData object,
+		and the RSSI (int). Each device address is yielded at most once.
+	"""
+	yielded_addresses: Set[str] = set()
+	loop = asyncio.get_running_loop()
+	deadline = loop.time() + timeout
+	logger.info(f"Starting streaming scan for Open Bionics devices (timeout={timeout}s)...")
+
+	async with BleakScanner() as scanner:
+		advertisements = scanner.advertisement_data()
+		while True:
+			remaining = deadline - loop.time()
+			if remaining <= 0:
+				break
+			try:
+				device, advertisement_data = await asyncio.wait_for(advertisements.__anext__(), timeout=remaining)
+			except (asyncio.TimeoutError, StopAsyncIteration):
+				break
+
+			# Skip devices already reported before paying the parsing cost
+			if device.address in yielded_addresses:
+				continue
+
+			parsed_ad = parse_advertisement_data(advertisement_data)
+			if parsed_ad is None:
+				continue
+			if device_type is not None and parsed_ad.device_config.device_type != device_type:
+				continue
+
+			yielded_addresses.add(device.address)
+			logger.info(f"Found matching device: {device.address} ({device.name}) - Type: {parsed_ad.device_config.device_type.name}")
+			yield device, parsed_ad, advertisement_data.rssi
+
+	logger.info(f"Streaming scan finished. Found {len(yielded_addresses)} matching Open Bionics devices.")
+
 # Future additions:
 # - Base Device class
 # - Connection logic
@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple, Any, Dict
 from enum import Enum
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
 
@@ -93,12 +94,39 @@ class Hand:
 		self._notifications_started = False # To track if start_notify has been called successfully
 		# For a more generic command/response system:
 		self._pending_command_futures: Dict[int, asyncio.Future] = {} # Key: Command ID
+		# Resolved control characteristic, saves bleak a UUID lookup on every write
+		self._control_char: Optional[BleakGATTCharacteristic] = None
 
 	@property
 	def address(self) -> str:
 		"""Returns the MAC address of the hand."""
 		return self._address
 
+	def resolve_control_characteristic(self) -> bool:
+		"""Looks up the control characteristic once so later writes can skip the UUID lookup.
+
+		Call after connecting (services must have been discovered). If the characteristic
+		cannot be resolved, writes continue to address it by UUID.
+
+		Returns:
+			True if the characteristic was resolved, False otherwise.
+		"""
+		try:
+			self._control_char = self._client.services.get_characteristic(CONTROL_CHARACTERISTIC_UUID)
+		except Exception as e:
+			logger.warning(f"[{self.address}] Failed to resolve Control Characteristic {CONTROL_CHARACTERISTIC_UUID}: {e}")
+			self._control_char = None
+		if None is self._control_char:
+			logger.warning(f"[{self.address}] Control Characteristic {CONTROL_CHARACTERISTIC_UUID} not found, writes will use its UUID.")
+			return False
+		logger.debug(f"[{self.address}] Resolved Control Characteristic to handle {self._control_char.handle}.")
+		return True
+
+	@property
+	def _control_write_target(self):
+		"""The resolved control characteristic if available, otherwise its UUID."""
+		return self._control_char if self._control_char is not None else CONTROL_CHARACTERISTIC_UUID
+
 	async def set_digit_positions(self, positions: dict[int, float]):
 		"""Sets the position of the specified digits (0.0 to 1.0).
 		This is treated as a fire-and-forget command; no response is awaited.
@@ -137,7 +165,7 @@ class Hand:
 
 		try:
 			logger.info(f"[{self.address}] Sending Set Digit Positions (CMD 0x{CMD_SET_DIGIT_POSITIONS:02X}, Fire-and-forget): {command_packet.hex()}")
-			await self._client.write_gatt_char(CONTROL_CHARACTERISTIC_UUID, command_packet, response=False)
+			await self._client.write_gatt_char(self._control_write_target, command_packet, response=False)
 			logger.debug(f"[{self.address}] Set Digit Positions command sent.")
 		except BleakError as e:
 			logger.error(f"[{self.address}] BleakError during Set Digit Positions: {e}")
@@ -167,7 +195,7 @@ class Hand:
 
 		try:
 			logger.info(f"[{self.address}] Sending Set Grip (CMD 0x{CMD_SET_GRIP:02X}, Fire-and-forget): {command_packet.hex()}")
-			await self._client.write_gatt_char(CONTROL_CHARACTERISTIC_UUID, command_packet, response=False)
+			await self._client.write_gatt_char(self._control_write_target, command_packet, response=False)
 			logger.debug(f"[{self.address}] Set Grip ({grip.name}) command sent.")
 		except BleakError as e:
 			logger.error(f"[{self.address}] BleakError during Set Grip: {e}")
@@ -371,7 +399,7 @@ class Hand:
 		
 		try:
 			logger.info(f"[{self.address}] Sending CMD 0x{command_id:02X} (Ctrl:0x{control_byte_request:02X}, Len:{data_length}): {command_packet.hex()}")
-			await self._client.write_gatt_char(CONTROL_CHARACTERISTIC_UUID, command_packet, response=False)
+			await self._client.write_gatt_char(self._control_write_target, command_packet, response=False)
 
 			# Wait for the _control_notification_handler to set the result of current_request_future
 			# The handler will parse the response specific to this command_id
@@ -472,4 +500,40 @@ class Hand:
 			return None
 		except Exception as e: # Catch any other unexpected errors from the call
 			logger.error(f"[{self.address}] Unexpected exception when getting temperature: {e}", exc_info=True)
-			return None 
\ No newline at end of file
+			return None 
+
+	async def get_humidity_and_temperature(self, timeout: float = 5.0) -> Tuple[Optional[float], Optional[float]]:
+		"""
+		Sends a single command to the hand to get both the relative humidity and temperature.
+		get_relative_humidity and get_temperature each send this same command, so reading both
+		values through them costs two round trips (and they cannot run concurrently).
+		Returns (humidity, temperature). Temperature is None for a humidity only (4-byte)
+		response, and both are None if the command fails.
+		"""
+		if not self._client.is_connected:
+			logger.error(f"[{self.address}] Cannot get humidity and temperature: Not connected.")
+			return None, None
+
+		request_payload = b''
+		try:
+			result = await self._send_command_and_process_response(
+				command_id=CMD_GET_RELATIVE_HUMIDITY,
+				request_payload=request_payload,
+				timeout=timeout
+			)
+
+			if isinstance(result, tuple) and len(result) == 2:
+				return result[0], result[1]
+			elif isinstance(result, float):
+				# Received only humidity (4-byte response), temperature is not available
+				logger.warning(f"[{self.address}] Received humidity only response (4 bytes), temperature not available.")
+				return result, None
+			else:
+				logger.error(f"[{self.address}] Get Humidity and Temperature received unexpected result type/value: {type(result)}. Value: {result}")
+				return None, None
+		except HandCommandError as e:
+			logger.error(f"[{self.address}] Failed to get humidity and temperature: {e}")
+			return None, None
+		except Exception as e: # Catch any other unexpected errors from the call
+			logger.error(f"[{self.address}] Unexpected exception when getting humidity and temperature: {e}", exc_info=True)
+			return None, None
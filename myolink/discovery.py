@@ -153,6 +153,22 @@ def parse_advertisement_data(ad_data: AdvertisementData) -> Optional[ParsedAdver
     if mfg_data is None:
         return None # Not an Open Bionics device (based on Company ID)
 
+    return parse_manufacturer_data(mfg_data)
+
+def parse_manufacturer_data(mfg_data: bytes) -> Optional[ParsedAdvertisingData]:
+    """Parses the Open Bionics manufacturer specific data payload.
+
+    The payload is the value stored against OPEN_BIONICS_COMPANY_ID in the
+    advertisement's manufacturer data. Taking the raw bytes (rather than the
+    whole AdvertisementData) allows callers to cache results keyed on the payload.
+
+    Args:
+        mfg_data: The raw Open Bionics manufacturer data bytes.
+
+    Returns:
+        A ParsedAdvertisingData object if the data is parsed successfully,
+        otherwise None.
+    """
     try:
         if len(mfg_data) < 1: # Need at least schema version
             logger.warning(f"OB Mfg data too short: {mfg_data.hex()}")
@@ -30,6 +30,9 @@ DATA_STREAM_SCHEMA_VERSION = 0x00
 # CONTROL_COMMAND_SCHEMA_VERSION = 0x00 # No longer needed
 # CONTROL_CMD_STATUS_IS_REQUEST = 0b00000001 # No longer needed
 
+# Data Stream (0x3102) packet header, schema version 0: B=uint8, f=float32 (big-endian)
+_STREAM_HEADER = struct.Struct('>BBBffB')
+
 # --- Active Stream Types (Upper Nibble of Config Byte) ---
 # From section 9.2.2.4.1
 ACTIVE_STREAM_NONE = 0x00
@@ -413,14 +416,14 @@ class MyoPod:
             # Offset 7: Conversion Factor (float32, big-endian)
             # Offset 11: Stream Data Length (uint8)
             # Offset 12: Stream Data (variable)
-            header_format = '>BBBffB' # B=uint8, H=uint16, f=float32
-            header_size = struct.calcsize(header_format)
+            header_size = _STREAM_HEADER.size
 
             if len(data) < header_size:
                 logger.error(f"Stream data packet too short for header: {len(data)} bytes")
                 return None
 
-            data_schema, block_num, active_byte, timestamp, conv_factor, data_len = struct.unpack(header_format, data[:header_size])
+            # Fields are unpacked straight from the notification buffer, without slicing copies
+            data_schema, block_num, active_byte, timestamp, conv_factor, data_len = _STREAM_HEADER.unpack_from(data)
 
             if DATA_STREAM_SCHEMA_VERSION != data_schema:
                 logger.warning(f"Unexpected data stream schema version: {data_schema}. Parsing as version 0.")
@@ -429,8 +432,6 @@ class MyoPod:
                 logger.error(f"Stream data packet shorter than indicated data length: {len(data)} bytes, expected {header_size + data_len}")
                 return None
 
-            stream_data_bytes = data[header_size : header_size + data_len]
-
             # --- Parse Stream Data based on Compression Type ---
             compression_type_val = active_byte & 0x0F
             data_points = []
@@ -448,7 +449,7 @@ class MyoPod:
                      logger.warning(f"Data length {data_len} not multiple of 4 for No Compression.")
                 format_string = f'>{num_samples}f' # e.g., '>5f' for 5 floats
                 if num_samples > 0:
-                    data_points = list(struct.unpack(format_string, stream_data_bytes[:num_samples*4]))
+                    data_points = struct.unpack_from(format_string, data, header_size)
 
             elif CompressionType.INT16 == compression_type:
                 # 16-bit signed int per sample (2 bytes)
@@ -457,14 +458,14 @@ class MyoPod:
                     logger.warning(f"Data length {data_len} not multiple of 2 for Integer Conversion.")
                 format_string = f'>{num_samples}h' # 'h' is short signed int
                 if num_samples > 0:
-                    data_points = list(struct.unpack(format_string, stream_data_bytes[:num_samples*2]))
+                    data_points = struct.unpack_from(format_string, data, header_size)
 
             elif CompressionType.RES_LIMIT_8BIT == compression_type:
                 # 8-bit signed int per sample (1 byte)
                 num_samples = data_len
                 format_string = f'>{num_samples}b' # 'b' is signed char
                 if num_samples > 0:
-                    data_points = list(struct.unpack(format_string, stream_data_bytes))
+                    data_points = struct.unpack_from(format_string, data, header_size)
 
             elif CompressionType.BYTE_PACK_12BIT == compression_type:
                 # 4x 12-bit signed int packed into 6 bytes
@@ -472,12 +473,10 @@ class MyoPod:
                 if data_len % 6 != 0:
                     logger.warning(f"Data length {data_len} not multiple of 6 for Byte Packing.")
 
-                for i in range(num_frames):
-                    frame_bytes = stream_data_bytes[i*6 : (i+1)*6]
-                    if len(frame_bytes) < 6: continue # Should not happen if check above works
-
-                    # Unpack the 6 bytes into 3 uint16 values (big-endian)
-                    val0, val1, val2 = struct.unpack('>HHH', frame_bytes)
+                # Unpack every frame's 6 bytes as 3 uint16 values (big-endian) in one call
+                words = struct.unpack_from(f'>{num_frames * 3}H', data, header_size)
+                for i in range(0, len(words), 3):
+                    val0, val1, val2 = words[i], words[i + 1], words[i + 2]
 
                     # Reconstruct the four 12-bit signed values
                     s0 = (val0 >> 4)           # Top 12 bits of val0
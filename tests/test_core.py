@@ -0,0 +1,102 @@
+"""Tests for streaming device discovery."""
+
+import pytest
+import asyncio
+import struct
+from unittest.mock import MagicMock, patch
+
+# Add project root to path for testing
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from myolink.core import discover_devices_iter
+from myolink.discovery import OPEN_BIONICS_COMPANY_ID, DeviceType
+
+# --- Helper Functions --- #
+
+def build_advertisement(address: str, device_type: DeviceType, rssi: int = -60, company_id: int = OPEN_BIONICS_COMPANY_ID):
+	"""Helper to construct a (BLEDevice, AdvertisementData) pair carrying a schema V2 payload."""
+	device = MagicMock()
+	device.address = address
+	device.name = f"Device {address}"
+	ad_data = MagicMock()
+	ad_data.rssi = rssi
+	payload = bytes([2, device_type.value << 1, 0x00, 80]) + struct.pack('>I', 0xDEADBEEF) + bytes([0])
+	ad_data.manufacturer_data = {company_id: payload}
+	return device, ad_data
+
+class FakeScanner:
+	"""Stands in for BleakScanner, replaying advertisements then optionally waiting forever."""
+	def __init__(self, advertisements, hang_when_done: bool = True):
+		self._advertisements = advertisements
+		self._hang_when_done = hang_when_done
+		self.scanning = False
+
+	def __call__(self, *args, **kwargs):
+		return self
+
+	async def __aenter__(self):
+		self.scanning = True
+		return self
+
+	async def __aexit__(self, *exc_info):
+		self.scanning = False
+
+	async def advertisement_data(self):
+		for advertisement in self._advertisements:
+			yield advertisement
+		if self._hang_when_done:
+			await asyncio.Event().wait()
+
+async def collect(**kwargs):
+	return [item async for item in discover_devices_iter(**kwargs)]
+
+# --- Test Cases --- #
+
+@pytest.mark.asyncio
+async def test_ShouldYieldEachAddressOnce_WhenDeviceReadvertises():
+	"""Verify repeated advertisements from one device are only yielded the first time."""
+	scanner = FakeScanner([build_advertisement("AA", DeviceType.OB2_HAND, rssi=-50),
+						   build_advertisement("AA", DeviceType.OB2_HAND, rssi=-40),
+						   build_advertisement("BB", DeviceType.OB2_HAND, rssi=-70)])
+	with patch('myolink.core.BleakScanner', scanner):
+		found = await collect(timeout=0.1)
+
+	assert ["AA", "BB"] == [device.address for device, _, _ in found]
+	assert [-50, -70] == [rssi for _, _, rssi in found]
+	assert DeviceType.OB2_HAND == found[0][1].device_config.device_type
+
+@pytest.mark.asyncio
+async def test_ShouldYieldOnlyMatchingType_WhenDeviceTypeGiven():
+	"""Verify other OB device types and non-OB advertisements are skipped."""
+	scanner = FakeScanner([build_advertisement("AA", DeviceType.HERO_ARM),
+						   build_advertisement("BB", DeviceType.OB2_HAND, company_id=0x004C),
+						   build_advertisement("CC", DeviceType.OB2_HAND)])
+	with patch('myolink.core.BleakScanner', scanner):
+		found = await collect(timeout=0.1, device_type=DeviceType.OB2_HAND)
+
+	assert ["CC"] == [device.address for device, _, _ in found]
+
+@pytest.mark.asyncio
+async def test_ShouldStopAtDeadline_WhenNoMoreAdvertisementsArrive():
+	"""Verify the scan ends once the timeout passes, even while waiting for the next advertisement."""
+	scanner = FakeScanner([build_advertisement("AA", DeviceType.OB2_HAND)])
+	with patch('myolink.core.BleakScanner', scanner):
+		found = await asyncio.wait_for(collect(timeout=0.1), timeout=2.0)
+
+	assert 1 == len(found)
+	assert not scanner.scanning
+
+@pytest.mark.asyncio
+async def test_ShouldStopScanning_WhenGeneratorClosedEarly():
+	"""Verify closing the generator after the first device exits the scanner context."""
+	scanner = FakeScanner([build_advertisement("AA", DeviceType.OB2_HAND),
+						   build_advertisement("BB", DeviceType.OB2_HAND)])
+	with patch('myolink.core.BleakScanner', scanner):
+		devices = discover_devices_iter(timeout=5.0)
+		device, _, _ = await devices.__anext__()
+		assert scanner.scanning
+		await devices.aclose()
+
+	assert "AA" == device.address
+	assert not scanner.scanning
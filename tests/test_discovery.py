@@ -0,0 +1,60 @@
+"""Tests for advertising data parsing."""
+
+import struct
+from unittest.mock import MagicMock
+
+# Add project root to path for testing
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from myolink.discovery import (
+	parse_advertisement_data,
+	parse_manufacturer_data,
+	OPEN_BIONICS_COMPANY_ID,
+	DeviceType,
+	HandSpecificData,
+)
+
+# --- Helper Function --- #
+
+def build_v2_hand_payload(battery: int = 80, associations: list[int] = None) -> bytes:
+	"""Helper to construct a schema V2 OB2 Hand manufacturer data payload."""
+	associations = associations or []
+	dev_config_byte = DeviceType.OB2_HAND.value << 1
+	payload = bytes([2, dev_config_byte, 0x00, battery]) + struct.pack('>I', 0xDEADBEEF) + bytes([len(associations)])
+	for assoc_id in associations:
+		payload += struct.pack('>I', assoc_id)
+	return payload
+
+# --- Test Cases --- #
+
+def test_ShouldParseHandPayload_WhenSchemaV2():
+	"""Verify a schema V2 hand payload is parsed from raw manufacturer bytes."""
+	parsed = parse_manufacturer_data(build_v2_hand_payload(battery=55, associations=[1, 2]))
+
+	assert parsed is not None
+	assert 2 == parsed.schema_version
+	assert DeviceType.OB2_HAND == parsed.device_config.device_type
+	assert isinstance(parsed.device_specific_data, HandSpecificData)
+	assert 55 == parsed.battery_level
+	assert 0xDEADBEEF == parsed.mac_address_part
+	assert [1, 2] == parsed.association_ids_v2
+
+def test_ShouldReturnNone_WhenManufacturerPayloadTooShort():
+	"""Verify a truncated payload is rejected."""
+	assert parse_manufacturer_data(bytes([2, 0x02, 0x00])) is None
+
+def test_ShouldMatchManufacturerParse_WhenParsingAdvertisement():
+	"""Verify parse_advertisement_data delegates to the manufacturer data parser."""
+	payload = build_v2_hand_payload()
+	ad_data = MagicMock()
+	ad_data.manufacturer_data = {OPEN_BIONICS_COMPANY_ID: payload}
+
+	assert parse_manufacturer_data(payload) == parse_advertisement_data(ad_data)
+
+def test_ShouldReturnNone_WhenNotOpenBionicsAdvertisement():
+	"""Verify advertisements without the OB Company ID are ignored."""
+	ad_data = MagicMock()
+	ad_data.manufacturer_data = {0x004C: b'\x01\x02'}
+
+	assert parse_advertisement_data(ad_data) is None
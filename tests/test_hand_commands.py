@@ -161,6 +161,39 @@ async def test_ShouldLogErrors_WhenInputIsInvalid(hand_instance, mock_bleak_clie
 	mock_bleak_client.write_gatt_char.assert_not_awaited()
 	# Check if either error or warning was called, as some invalid inputs might just warn 
 
+@pytest.mark.asyncio
+async def test_ShouldWriteToResolvedCharacteristic_WhenControlCharacteristicResolved(hand_instance, mock_bleak_client):
+	"""Verify writes use the pre-resolved characteristic instead of the UUID."""
+	mock_char = MagicMock()
+	mock_char.handle = 42
+	mock_bleak_client.services.get_characteristic.return_value = mock_char
+	positions_dict = {0: 0.5}
+
+	assert hand_instance.resolve_control_characteristic()
+	await hand_instance.set_digit_positions(positions_dict)
+
+	mock_bleak_client.services.get_characteristic.assert_called_once_with(CONTROL_CHARACTERISTIC_UUID)
+	mock_bleak_client.write_gatt_char.assert_awaited_once_with(
+		mock_char,
+		build_expected_command(positions_dict),
+		response=False
+	)
+
+@pytest.mark.asyncio
+async def test_ShouldWriteToUuid_WhenControlCharacteristicNotFound(hand_instance, mock_bleak_client):
+	"""Verify writes fall back to the UUID if the characteristic cannot be resolved."""
+	mock_bleak_client.services.get_characteristic.return_value = None
+	positions_dict = {0: 0.5}
+
+	assert not hand_instance.resolve_control_characteristic()
+	await hand_instance.set_digit_positions(positions_dict)
+
+	mock_bleak_client.write_gatt_char.assert_awaited_once_with(
+		CONTROL_CHARACTERISTIC_UUID,
+		build_expected_command(positions_dict),
+		response=False
+	)
+
 # --- Tests for set_grip --- #
 
 @pytest.mark.asyncio
@@ -762,3 +795,34 @@ async def test_GetRelativeHumidity_ShouldReturnHumidityFrom8ByteResponse(hand_in
 
 		# Assert the correct humidity was returned
 		assert humidity == pytest.approx(humidity_value), "get_relative_humidity should return the humidity from an 8-byte response."
+
+# --- Tests for get_humidity_and_temperature --- #
+
+@pytest.mark.asyncio
+async def test_ShouldReturnBothValues_WhenGettingHumidityAndTemperatureFrom8ByteResponse(hand_instance, mock_bleak_client):
+	"""Verify get_humidity_and_temperature returns both values from a single command."""
+	with patch.object(hand_instance, '_send_command_and_process_response', new_callable=AsyncMock, return_value=(65.0, 23.5)) as mock_send_command:
+
+		result = await hand_instance.get_humidity_and_temperature(timeout=1.0)
+
+		mock_send_command.assert_awaited_once_with(
+			command_id=CMD_GET_RELATIVE_HUMIDITY,
+			request_payload=b'',
+			timeout=1.0
+		)
+		assert (65.0, 23.5) == result
+
+@pytest.mark.asyncio
+async def test_ShouldReturnNoTemperature_WhenGettingHumidityAndTemperatureFrom4ByteResponse(hand_instance, mock_bleak_client):
+	"""Verify get_humidity_and_temperature returns None for temperature on a humidity only response."""
+	with patch.object(hand_instance, '_send_command_and_process_response', new_callable=AsyncMock, return_value=40.25):
+
+		assert (40.25, None) == await hand_instance.get_humidity_and_temperature(timeout=1.0)
+
+@pytest.mark.asyncio
+async def test_ShouldReturnNones_WhenHumidityAndTemperatureCommandFails(hand_instance, mock_bleak_client):
+	"""Verify get_humidity_and_temperature returns (None, None) when the command fails."""
+	simulated_error = HandCommandError("Simulated command failure", status=ResponseStatus.ERR_INTERNAL)
+	with patch.object(hand_instance, '_send_command_and_process_response', new_callable=AsyncMock, side_effect=simulated_error):
+
+		assert (None, None) == await hand_instance.get_humidity_and_temperature(timeout=1.0)
@@ -0,0 +1,133 @@
+"""Tests for the humidity monitor example's reading queue and CSV writer."""
+
+import pytest
+import logging
+import threading
+import time
+
+# Add project root to path for testing
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from examples import monitor_hand_humidity
+from examples.monitor_hand_humidity import CsvWriterThread, HumidityMonitor
+
+# --- Helper Functions --- #
+
+def read_when(path, expected: bytes, timeout: float = 2.0) -> bytes:
+	"""Helper to poll a file until it holds `expected`, returning its final contents."""
+	deadline = time.monotonic() + timeout
+	while True:
+		with open(path, 'rb') as f:
+			contents = f.read()
+		if contents == expected or time.monotonic() > deadline:
+			return contents
+		time.sleep(0.01)
+
+class StallingFile:
+	"""Stands in for the CSV file, blocking every write until released."""
+	def __init__(self):
+		self.release = threading.Event()
+		self.written = b""
+		self.closed = False
+
+	def write(self, data: bytes):
+		self.release.wait()
+		self.written += data
+
+	def flush(self):
+		pass
+
+	def close(self):
+		self.closed = True
+
+# --- Test Cases --- #
+
+def test_ShouldWriteAllRows_WhenClosed(tmp_path):
+	"""Verify rows still queued or batched are in the file once close() returns."""
+	path = tmp_path / "readings.csv"
+	writer = CsvWriterThread(open(path, 'wb'))
+	writer.start()
+	rows = [b"%d.000,50.00,20.00\r\n" % i for i in range(120)]
+	for row in rows:
+		writer.write_row(row)
+	writer.close()
+
+	assert not writer.is_alive()
+	assert b"".join(rows) == path.read_bytes()
+
+def test_ShouldWriteBatch_WhenBatchRowsReached(tmp_path, monkeypatch):
+	"""Verify a full batch is written without waiting for the flush interval or close."""
+	monkeypatch.setattr(monitor_hand_humidity, 'CSV_BATCH_ROWS', 3)
+	monkeypatch.setattr(monitor_hand_humidity, 'CSV_FLUSH_INTERVAL_S', 60.0)
+	path = tmp_path / "readings.csv"
+	writer = CsvWriterThread(open(path, 'wb'))
+	writer.start()
+	try:
+		for row in (b"a\r\n", b"b\r\n", b"c\r\n", b"d\r\n"):
+			writer.write_row(row)
+
+		assert b"a\r\nb\r\nc\r\n" == read_when(path, b"a\r\nb\r\nc\r\n")
+	finally:
+		writer.close()
+	assert b"a\r\nb\r\nc\r\nd\r\n" == path.read_bytes()
+
+def test_ShouldWritePartialBatch_WhenFlushIntervalPasses(tmp_path, monkeypatch):
+	"""Verify a batch below CSV_BATCH_ROWS is written once it is CSV_FLUSH_INTERVAL_S old, with no further rows."""
+	monkeypatch.setattr(monitor_hand_humidity, 'CSV_FLUSH_INTERVAL_S', 0.05)
+	path = tmp_path / "readings.csv"
+	writer = CsvWriterThread(open(path, 'wb'))
+	writer.start()
+	try:
+		writer.write_row(b"a\r\n")
+
+		assert b"a\r\n" == read_when(path, b"a\r\n")
+	finally:
+		writer.close()
+
+def test_ShouldWarnAndKeepWaiting_WhenCloseTakesTooLong(caplog):
+	"""Verify close() logs a warning but only returns once the last rows are written and the file closed."""
+	csv_file = StallingFile()
+	writer = CsvWriterThread(csv_file)
+	writer.start()
+	writer.write_row(b"a\r\n")
+	threading.Timer(0.2, csv_file.release.set).start()
+
+	with caplog.at_level(logging.WARNING):
+		writer.close(warn_after=0.05)
+
+	assert "still writing" in caplog.text
+	assert b"a\r\n" == csv_file.written
+	assert csv_file.closed
+
+@pytest.mark.asyncio
+async def test_ShouldLogReadingTime_WhenRowHandledLater(tmp_path):
+	"""Verify CSV rows carry the time the reading was queued, relative to the file start, not the time they are written."""
+	path = tmp_path / "readings.csv"
+	monitor = HumidityMonitor()
+	monitor._csv_writer = CsvWriterThread(open(path, 'wb'))
+	monitor._csv_writer.start()
+	monitor._csv_start_monotonic = time.monotonic() - 10.0
+
+	monitor._queue_reading(45.5, None)
+	monitor._queue_reading(None, None) # Nothing to log, so not queued
+	read_monotonic, humidity_value, temperature_value = monitor._readings.get_nowait()
+	assert monitor._readings.empty()
+	time.sleep(0.1) # A backlog before the consumer gets to the reading
+	monitor._log_to_csv(read_monotonic, humidity_value, temperature_value)
+	monitor._close_csv()
+
+	elapsed, humidity, temperature = path.read_bytes().decode().rstrip("\r\n").split(",")
+	assert 10.0 <= float(elapsed) < 10.05
+	assert ("45.50", "") == (humidity, temperature)
+
+@pytest.mark.asyncio
+async def test_ShouldWriteFixedHeader_WhenCsvOpened(tmp_path, monkeypatch):
+	"""Verify the CSV header is the same in every file, so columns can be selected by name."""
+	monkeypatch.setattr(monitor_hand_humidity, 'CSV_OUTPUT_DIR', str(tmp_path))
+	monitor = HumidityMonitor()
+	monitor._setup_csv()
+	monitor._close_csv()
+
+	(csv_path,) = tmp_path.iterdir()
+	assert b"Elapsed (s),RelativeHumidity (%),Temperature (\xc2\xb0C)\r\n" == csv_path.read_bytes()
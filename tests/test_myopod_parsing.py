@@ -0,0 +1,55 @@
+"""Tests for MyoPod stream data packet parsing."""
+
+import struct
+
+# Add project root to path for testing
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from myolink.myopod import MyoPod, EmgStreamSource, CompressionType
+
+# --- Helper Function --- #
+
+def build_stream_packet(compression: CompressionType, stream_data: bytes, conv_factor: float = 0.5, timestamp: float = 1.25) -> bytearray:
+	"""Helper to construct a schema V0 Data Stream notification."""
+	active_byte = (EmgStreamSource.PROCESSED_EMG.value << 4) | compression.value
+	header = struct.pack('>BBBffB', 0, 7, active_byte, timestamp, conv_factor, len(stream_data))
+	return bytearray(header + stream_data)
+
+# --- Test Cases --- #
+
+def test_ShouldScaleSamples_WhenInt16Compressed():
+	"""Verify INT16 samples are unpacked and multiplied by the conversion factor."""
+	packet = MyoPod._parse_stream_data(build_stream_packet(CompressionType.INT16, struct.pack('>3h', 100, -200, 4)))
+
+	assert packet is not None
+	assert 7 == packet.block_number
+	assert 1.25 == packet.timestamp
+	assert EmgStreamSource.PROCESSED_EMG == packet.active_stream_source
+	assert CompressionType.INT16 == packet.compression_type
+	assert [50.0, -100.0, 2.0] == packet.data_points
+
+def test_ShouldUnpackFloats_WhenUncompressed():
+	"""Verify float32 samples are unpacked when no compression is used."""
+	packet = MyoPod._parse_stream_data(build_stream_packet(CompressionType.NONE, struct.pack('>2f', 1.5, -3.0), conv_factor=1.0))
+
+	assert [1.5, -3.0] == packet.data_points
+
+def test_ShouldUnpackSignedValues_When12BitPacked():
+	"""Verify four signed 12-bit values are recovered from each 6-byte frame."""
+	values = [5, -1, 2047, -2048]
+	raw = [v & 0x0FFF for v in values]
+	val0 = (raw[0] << 4) | (raw[1] >> 8)
+	val1 = ((raw[1] & 0xFF) << 8) | (raw[2] >> 4)
+	val2 = ((raw[2] & 0x0F) << 12) | raw[3]
+	stream_data = struct.pack('>3H', val0, val1, val2) * 2
+
+	packet = MyoPod._parse_stream_data(build_stream_packet(CompressionType.BYTE_PACK_12BIT, stream_data, conv_factor=1.0))
+
+	assert values * 2 == packet.data_points
+
+def test_ShouldReturnNone_WhenDataShorterThanDeclared():
+	"""Verify a packet truncated below its declared data length is rejected."""
+	truncated = build_stream_packet(CompressionType.INT16, struct.pack('>2h', 1, 2))[:-1]
+
+	assert MyoPod._parse_stream_data(truncated) is None